@@ -1556,9 +1556,11 @@ try:
         Returns:
             JSON with history list (most recent first).
         """
+        # One snapshot: each call rebuilds the list from the history store.
+        history = get_analysis_history()
         return web.json_response({
-            "history": get_analysis_history(),
-            "count": len(get_analysis_history()),
+            "history": history,
+            "count": len(history),
         })
 
     @server.PromptServer.instance.routes.post("/debugger/clear_history")
@@ -131,6 +131,13 @@ def get_pipeline():
         _pipeline_instance = AnalysisPipeline(stages)
     return _pipeline_instance
 
+# Completion-check patterns, compiled once (is_complete_traceback runs per buffered line)
+_EXCEPTION_LINE_RE = re.compile(r'\n([A-Z][a-zA-Z0-9]*(?:Error|Exception|Warning|Interrupt)):.*')
+_VALIDATION_DETAIL_RE = re.compile(r'\n[*\-] ')
+# How far before `scan_from` the completion searches restart, so a marker split
+# across two buffered writes is still found.
+_COMPLETION_RESCAN_OVERLAP = 256
+
 # Helper for pre-compiling patterns (used by is_complete_traceback or legacy parts)
 @functools.lru_cache(maxsize=64)
 def _compile_pattern(pattern: str):
@@ -271,33 +278,32 @@ class ErrorAnalyzer:
             return (None, None)
     
     @staticmethod
-    def is_complete_traceback(text: str) -> bool:
+    def is_complete_traceback(text: str, scan_from: int = 0) -> bool:
         """
         Check if the text contains a complete Python traceback.
         Kept as utility.
+
+        scan_from: length of a prefix of text for which an earlier call returned
+            False. Callers that grow a buffer pass the previous length so the
+            completion markers are only searched for in the new tail.
         """
+        tail_start = max(0, scan_from - _COMPLETION_RESCAN_OVERLAP)
+
         # For standard Python tracebacks
         if "Traceback (most recent call last):" in text:
-            error_pattern = r'\n([A-Z][a-zA-Z0-9]*(?:Error|Exception|Warning|Interrupt)):.*'
-            has_python_error = bool(re.search(error_pattern, text))
-            if has_python_error:
+            if _EXCEPTION_LINE_RE.search(text, tail_start):
                 return True
 
         # For ComfyUI Validation Errors
         if "Failed to validate prompt for output" in text:
-            validation_count = text.count("Failed to validate prompt for output")
-            executing_marker = "Executing prompt:" in text
-
-            if executing_marker:
+            if text.find("Executing prompt:", tail_start) != -1:
                 return True
 
-            has_details = bool(re.search(r'\n[*\-] ', text))
-            if has_details and validation_count >= 1:
-                lines = text.strip().split('\n')
-                if lines:
-                    last_line = lines[-1].strip()
-                    if "Output will be ignored" in last_line or "Prompt executed" in last_line:
-                        return True
+            # Only the last line matters; avoid splitting the whole (growing) buffer.
+            last_line = text.strip().rsplit('\n', 1)[-1].strip()
+            if "Output will be ignored" in last_line or "Prompt executed" in last_line:
+                if _VALIDATION_DETAIL_RE.search(text):
+                    return True
 
         return False
 
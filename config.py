@@ -60,9 +60,11 @@ class DiagnosticsConfig:
     log_queue_maxsize: int = 1000
     
     # History
-    # history_size: 0 = unbounded, >0 = max entries
+    # history_size: 0 = no entry-count limit, >0 = max entries
     history_size: int = 0
-    # history_size_bytes: Max size in bytes for history file (default 5MB)
+    # history_size_bytes: Max size in bytes for the history file (default 5MB).
+    # Also caps the error text kept in the in-memory history, oldest evicted
+    # first, even when history_size=0. 0 disables both limits.
     history_size_bytes: int = 5 * 1024 * 1024
     
     # i18n
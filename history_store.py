@@ -10,7 +10,7 @@ import os
 import threading
 import shutil
 import hashlib
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, replace
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -118,7 +118,8 @@ class HistoryStore:
         self._filepath = filepath
         self._maxlen = maxlen  # 0 or negative means unbounded
         self._max_bytes = max_bytes
-        self._lock = threading.Lock()
+        # Reentrant so callers can hold it across several calls that must be atomic.
+        self._lock = threading.RLock()
         self._history: List[HistoryEntry] = []
         self._loaded = False
         # Aggregation window: within this window, repeated identical errors are aggregated.
@@ -248,61 +249,99 @@ class HistoryStore:
         """
         with self._lock:
             self._load()
+            self._merge_entry(entry)
+            self._save()
 
-            # Normalize aggregation fields
-            if not entry.first_seen:
-                entry.first_seen = entry.timestamp
-            if not entry.last_seen:
-                entry.last_seen = entry.timestamp
-            if not entry.error_signature:
-                entry.error_signature = self._compute_signature(entry.error)
+    def append_many(self, entries: List[HistoryEntry]) -> None:
+        """
+        Append several entries with a single disk write.
 
-            # Aggregate repeated identical errors within the time window.
-            # This prevents unbounded growth when the same error repeats rapidly.
-            if self._history:
-                now_ts = self._parse_ts(entry.timestamp)
-                # Search from newest to oldest for a matching signature within the window.
-                for existing in reversed(self._history):
-                    if not existing:
-                        continue
-                    sig = existing.error_signature or self._compute_signature(existing.error)
-                    if sig != entry.error_signature:
-                        continue
-                    last_seen_ts = self._parse_ts(existing.last_seen or existing.timestamp)
-                    if (now_ts - last_seen_ts).total_seconds() <= self._aggregate_window_seconds:
-                        existing.repeat_count = int(getattr(existing, "repeat_count", 1) or 1) + 1
-                        existing.last_seen = entry.timestamp
-                        # Best-effort: keep richer metadata if the new entry has it.
-                        if not existing.node_context and entry.node_context:
-                            existing.node_context = entry.node_context
-                        if (not existing.suggestion) and entry.suggestion:
-                            existing.suggestion = entry.suggestion
-                        if not existing.analysis_metadata and entry.analysis_metadata:
-                            existing.analysis_metadata = entry.analysis_metadata
-                        self._save()
-                        return
+        Same semantics as calling append() for each entry in order, but the
+        history file is rewritten once instead of once per entry.
 
-            self._history.append(entry)
-            
-            # Trim to maxlen (only if bounded)
-            if self._maxlen > 0 and len(self._history) > self._maxlen:
-                self._history = self._history[-self._maxlen:]
-            
+        Args:
+            entries: HistoryEntry objects, oldest first
+        """
+        if not entries:
+            return
+        with self._lock:
+            self._load()
+            for entry in entries:
+                self._merge_entry(entry)
             self._save()
+
+    def _merge_entry(self, entry: HistoryEntry) -> None:
+        """Aggregate or append one entry in memory (caller holds the lock and saves)."""
+        # Normalize aggregation fields
+        if not entry.first_seen:
+            entry.first_seen = entry.timestamp
+        if not entry.last_seen:
+            entry.last_seen = entry.timestamp
+        if not entry.error_signature:
+            entry.error_signature = self._compute_signature(entry.error)
+
+        # Aggregate repeated identical errors within the time window.
+        # This prevents unbounded growth when the same error repeats rapidly.
+        if self._history:
+            now_ts = self._parse_ts(entry.timestamp)
+            # Search from newest to oldest for a matching signature within the window.
+            for existing in reversed(self._history):
+                if not existing:
+                    continue
+                sig = existing.error_signature
+                if not sig:
+                    # Legacy entries predate stored signatures; hash once and keep it.
+                    sig = existing.error_signature = self._compute_signature(existing.error)
+                if sig != entry.error_signature:
+                    continue
+                last_seen_ts = self._parse_ts(existing.last_seen or existing.timestamp)
+                if (now_ts - last_seen_ts).total_seconds() <= self._aggregate_window_seconds:
+                    existing.repeat_count = int(getattr(existing, "repeat_count", 1) or 1) + 1
+                    existing.last_seen = entry.timestamp
+                    # Best-effort: keep richer metadata if the new entry has it.
+                    if not existing.node_context and entry.node_context:
+                        existing.node_context = entry.node_context
+                    if (not existing.suggestion) and entry.suggestion:
+                        existing.suggestion = entry.suggestion
+                    if not existing.analysis_metadata and entry.analysis_metadata:
+                        existing.analysis_metadata = entry.analysis_metadata
+                    return
+
+        self._history.append(entry)
+        
+        # Trim to maxlen (only if bounded)
+        if self._maxlen > 0 and len(self._history) > self._maxlen:
+            self._history = self._history[-self._maxlen:]
     
-    def get_all(self) -> List[Dict[str, Any]]:
+    def get_all(self, pending: Optional[List[HistoryEntry]] = None) -> List[Dict[str, Any]]:
         """
         Get all history entries as dictionaries.
         
         Returns entries in reverse chronological order (newest first).
         
+        Args:
+            pending: Entries not written yet, oldest first. They are merged into
+                     the result as append() would merge them, without changing
+                     the stored history or the file.
+        
         Returns:
             List of entry dictionaries
         """
         with self._lock:
             self._load()
+            history = self._history
+            if pending:
+                # _merge_entry works on self._history in place: merge copies.
+                stored = self._history
+                self._history = [replace(entry) for entry in stored]
+                try:
+                    for entry in pending:
+                        self._merge_entry(replace(entry))
+                    history = self._history
+                finally:
+                    self._history = stored
             # Return in reverse order (newest first)
-            return [entry.to_dict() for entry in reversed(self._history)]
+            return [entry.to_dict() for entry in reversed(history)]
     
     def get_latest(self) -> Optional[Dict[str, Any]]:
         """
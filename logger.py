@@ -5,6 +5,7 @@ Intercepts stdout/stderr to capture logs and provide real-time error analysis.
 ARCHITECTURE (v1.7.5):
 - SafeStreamWrapper: Wraps sys.stdout/stderr (after ComfyUI's LogInterceptor if present)
 - DoctorLogProcessor: Background thread that processes queued messages
+- DoctorHistoryWriter: Background thread that persists recorded errors to disk
 - Zero deadlock risk: write() holds no locks, only enqueues messages
 
 Previous issues (v1.2.x):
@@ -16,22 +17,23 @@ See: .planning/STAGE1_LOGGER_FIX_PLAN.md for full design details
 """
 
 import sys
-import datetime
 import threading
 import queue
 import time
 import os
 import logging
 import hashlib
+import re
 from collections import deque
-from typing import Optional, Dict, Any, List
+import functools
+from typing import Optional, Dict, Any, List, Tuple
 
 try:
-    from .services.time_utils import UTC_MIN, parse_utc_timestamp, utc_filename_timestamp, utc_isoformat
+    from .services.time_utils import utc_filename_timestamp, utc_isoformat, utc_now
 except ImportError as import_error:
     from import_compat import ensure_absolute_import_fallback_allowed
     ensure_absolute_import_fallback_allowed(import_error)
-    from services.time_utils import UTC_MIN, parse_utc_timestamp, utc_filename_timestamp, utc_isoformat
+    from services.time_utils import utc_filename_timestamp, utc_isoformat, utc_now
 
 # ==============================================================================
 # R22: Asyncio transport GC exclusion patterns
@@ -46,6 +48,30 @@ _ASYNCIO_GC_EXCLUSION_PATTERNS = (
 )
 
 
+def _contains_any(message: str, markers: tuple) -> bool:
+    """Return True if any marker occurs in message.
+
+    A plain loop over a prebuilt tuple measured faster than both any(<genexpr>)
+    and a compiled regex alternation for typical console lines.
+    """
+    for marker in markers:
+        if marker in message:
+            return True
+    return False
+
+
+def _prune_subsumed(markers: tuple) -> tuple:
+    """Drop markers that contain another marker of the same set.
+
+    Such markers can never change the result of _contains_any(), so removing
+    them saves one full scan of every message per dropped marker.
+    """
+    return tuple(
+        marker for marker in markers
+        if not any(other != marker and other in marker for other in markers)
+    )
+
+
 def _is_asyncio_gc_noise(message: str) -> bool:
     """Check if a message is a known-benign asyncio transport GC warning.
 
@@ -56,7 +82,7 @@ def _is_asyncio_gc_noise(message: str) -> bool:
     """
     if not message:
         return False
-    return any(pat in message for pat in _ASYNCIO_GC_EXCLUSION_PATTERNS)
+    return _contains_any(message, _ASYNCIO_GC_EXCLUSION_PATTERNS)
 
 
 # IMPORTANT: keep legacy emoji markers here for backward compatibility
@@ -78,12 +104,64 @@ _ASCII_TENSOR_ALERT_MARKERS = (
     "CRITICAL: Tensor contains",
     "WARNING: Meta Tensor",
 )
+_TENSOR_ALERT_MARKERS = _prune_subsumed(_ASCII_TENSOR_ALERT_MARKERS + _LEGACY_TENSOR_ALERT_MARKERS)
+
+# Doctor's diagnostic block layout (see DoctorLogProcessor._record_analysis).
+_OUTPUT_RULE = "-" * 40
+_OUTPUT_HEADER = "\n" + _OUTPUT_RULE
+_OUTPUT_FOOTER = _OUTPUT_RULE + "\n"
+_ERROR_LOCATION_PREFIX = "ERROR LOCATION: "
+
+# Doctor's own console output; never re-analysed (see _process_message_locked).
+_DOCTOR_OUTPUT_MARKERS = _prune_subsumed((
+    "[Doctor]",       # Internal logging prefix
+    "[Doctor-API]",   # API logging prefix
+    _OUTPUT_RULE,     # Divider line
+) + _ASCII_DOCTOR_OUTPUT_MARKERS + _LEGACY_DOCTOR_OUTPUT_MARKERS)
+
+
+# Console lines that never count as errors on their own (see _record_analysis).
+_NORMAL_MESSAGE_MARKERS = (
+    "Prompt executed in",
+    "got prompt",
+    "Executing node",
+    "To see the GUI go to:",
+    "Starting server",
+)
+
+# At least one of these must appear for unmatched text to be recorded.
+_ERROR_INDICATOR_MARKERS = (
+    "Traceback (most recent call last):",
+    "Error:",
+    "Error ",  # Catch RuntimeError, ValueError etc without colon
+    "Exception:",
+    "Exception ",
+    "Failed to validate",
+    "❌ CRITICAL",
+    "⚠️ Meta Tensor",
+    "CRITICAL: Tensor contains",
+    "WARNING: Meta Tensor",
+)
+
+
+def _is_doctor_output(message: str) -> bool:
+    """Equivalent to _contains_any(message, _DOCTOR_OUTPUT_MARKERS), but cheaper.
+
+    Markers sharing a substring ("[Doctor", "ION:") are probed through it first,
+    so an ordinary console line costs three scans instead of one per marker; a
+    regex alternation over the markers measured slower than either.
+    """
+    if "[Doctor" in message and ("[Doctor]" in message or "[Doctor-API]" in message):
+        return True
+    if "ION:" in message and _contains_any(message, _ASCII_DOCTOR_OUTPUT_MARKERS):
+        return True
+    return _OUTPUT_RULE in message
 
 
 def _contains_tensor_alert(message: str) -> bool:
     if not message:
         return False
-    return any(marker in message for marker in (_LEGACY_TENSOR_ALERT_MARKERS + _ASCII_TENSOR_ALERT_MARKERS))
+    return _contains_any(message, _TENSOR_ALERT_MARKERS)
 
 
 def _normalize_backend_suggestion(text: str) -> str:
@@ -154,11 +232,56 @@ _last_analysis: Dict[str, Any] = {
 # P1: Error history buffer (ring buffer for last N errors)
 # When history_size=0, use unbounded deque
 _analysis_history: deque = deque() if CONFIG.history_size == 0 else deque(maxlen=CONFIG.history_size)
+# Most-recent-first tuple of copies of the _analysis_history entries, published
+# for lock-free readers. The copies are built under _history_lock and never
+# mutated; every writer (append, repeat aggregation, resolution status) resets
+# it to None under the lock and the next reader rebuilds it.
+_analysis_snapshot: Optional[Tuple[Dict[str, Any], ...]] = None
+# error_signature -> (most recent _analysis_history entry with that signature,
+# its last_seen as epoch seconds), so repeat aggregation is one lookup and a
+# float compare instead of a backwards scan that re-parses ISO timestamps.
+_signature_index: Dict[str, Tuple[Dict[str, Any], float]] = {}
+# Characters of error text held by _analysis_history. history_size_bytes caps
+# it as well as the persisted file (see config.py), even when history_size=0
+# means no count limit, so long sessions do not grow forever.
+_analysis_history_chars = 0
+
+
+def _pop_oldest_history_entry() -> None:
+    """Evict the oldest in-memory history entry (caller holds _history_lock)."""
+    global _analysis_history_chars
+    evicted = _analysis_history.popleft()
+    _analysis_history_chars -= len(evicted.get("error") or "")
+    evicted_signature = evicted.get("error_signature")
+    if _signature_index.get(evicted_signature, (None,))[0] is evicted:
+        del _signature_index[evicted_signature]
+
+
+def _append_history_entry(entry: Dict[str, Any], last_seen_epoch: float) -> None:
+    """Append to the in-memory history within its count and size limits (lock held)."""
+    global _analysis_history_chars, _analysis_snapshot
+    # Evict explicitly rather than letting deque(maxlen) drop silently, so the
+    # signature index and size counter stay in sync.
+    if _analysis_history.maxlen is not None and len(_analysis_history) >= _analysis_history.maxlen:
+        _pop_oldest_history_entry()
+    _analysis_history.append(entry)
+    _analysis_history_chars += len(entry.get("error") or "")
+    _signature_index[entry["error_signature"]] = (entry, last_seen_epoch)
+    budget = getattr(CONFIG, "history_size_bytes", 0) or 0
+    while budget > 0 and _analysis_history_chars > budget and len(_analysis_history) > 1:
+        _pop_oldest_history_entry()
+    _analysis_snapshot = None
 
 # F1: Persistent history store
 # R18: Use canonical data directory via doctor_paths
 _current_dir = os.path.dirname(os.path.abspath(__file__))
 
+
+def _legacy_history_path() -> str:
+    """Pre-R18 history location inside the extension folder."""
+    return os.path.join(_current_dir, "logs", "error_history.json")
+
+
 def _resolve_history_path() -> str:
     """
     Choose a writable, stable location for history persistence.
@@ -175,9 +298,10 @@ def _resolve_history_path() -> str:
             return os.path.join(data_dir, "error_history.json")
         except Exception:
             pass
-    return os.path.join(_current_dir, "logs", "error_history.json")
+    return _legacy_history_path()
 
 
+# Resolved once at import; _get_history_store() and the migration reuse it.
 _history_file = _resolve_history_path()
 _history_store: Optional[HistoryStore] = None
 
@@ -186,7 +310,7 @@ def _migrate_legacy_data():
     if not doctor_paths:
         return
 
-    legacy_path = os.path.join(_current_dir, "logs", "error_history.json")
+    legacy_path = _legacy_history_path()
     target_path = _history_file
 
     # If legacy exists and target doesn't, migrate.
@@ -240,12 +364,20 @@ class DroppingQueue:
     - Non-priority messages are dropped when full.
     - Priority messages evict the oldest non-priority item if possible.
     - Drop counters are tracked for health/observability.
+
+    Producers (every thread that prints) append without taking the lock while
+    the queue has room: deque.append/len are atomic and only the consumer pops,
+    under the lock. The bound is therefore soft by at most one item per
+    concurrently writing thread; the full/evict path and all consumers lock.
     """
 
     def __init__(self, maxsize: int = 1000):
         self._maxsize = maxsize
         self._queue = deque()
-        self._cv = threading.Condition()
+        # Plain Lock (no method re-enters it) is cheaper than Condition's default RLock.
+        self._cv = threading.Condition(threading.Lock())
+        # Number of consumers blocked in get(); put_nowait() skips notify() when zero.
+        self._waiters = 0
         self._stats = {
             "queue_dropped_total": 0,
             "queue_dropped_priority": 0,
@@ -263,24 +395,43 @@ class DroppingQueue:
         else:
             self._stats["queue_dropped_non_priority"] += 1
 
-    def _remove_at(self, index: int):
-        self._queue.rotate(-index)
-        item = self._queue.popleft()
-        self._queue.rotate(index)
-        return item
-
     def _drop_oldest(self, prefer_non_priority: bool):
         if not self._queue:
             return None
         if prefer_non_priority:
-            for idx, item in enumerate(self._queue):
+            # Scan a snapshot: lock-free producers may append during the scan.
+            # Appends only extend the right end, so left-based indices stay valid.
+            for idx, item in enumerate(list(self._queue)):
                 if not item[0]:
-                    return self._remove_at(idx)
+                    removed = self._queue[idx]
+                    del self._queue[idx]
+                    return removed
         return self._queue.popleft()
 
+    def _wait_for_items(self, timeout: Optional[float]) -> None:
+        """Block (lock held) until an item is queued or timeout elapses."""
+        if self._queue:
+            return
+        self._waiters += 1
+        try:
+            # Re-check after announcing the waiter: a lock-free put that saw no
+            # waiters has already appended, so it cannot be missed here.
+            if not self._queue:
+                self._cv.wait(timeout)
+        finally:
+            self._waiters -= 1
+
     def put_nowait(self, item, priority: bool = False) -> bool:
+        pending = self._queue
+        if not self._maxsize or len(pending) < self._maxsize:
+            pending.append((priority, item))
+            if self._waiters:
+                with self._cv:
+                    self._cv.notify()
+            return True
+
         with self._cv:
-            if self._maxsize and len(self._queue) >= self._maxsize:
+            if len(self._queue) >= self._maxsize:
                 if priority:
                     dropped = self._drop_oldest(prefer_non_priority=True)
                     self._record_drop(dropped)
@@ -291,20 +442,28 @@ class DroppingQueue:
                     return False
 
             self._queue.append((priority, item))
-            self._cv.notify()
+            if self._waiters:
+                self._cv.notify()
             return True
 
     def get(self, timeout: float = None):
         with self._cv:
-            if not self._queue:
-                self._cv.wait(timeout)
+            self._wait_for_items(timeout)
             if not self._queue:
                 raise queue.Empty
             return self._queue.popleft()
 
-    def qsize(self) -> int:
+    def get_batch(self, timeout: float = None, max_items: int = 64) -> List[tuple]:
+        """Wait like get(), then pop up to max_items under a single lock acquisition."""
         with self._cv:
-            return len(self._queue)
+            self._wait_for_items(timeout)
+            if not self._queue:
+                raise queue.Empty
+            popleft = self._queue.popleft
+            return [popleft() for _ in range(min(max_items, len(self._queue)))]
+
+    def qsize(self) -> int:
+        return len(self._queue)
 
     def get_stats(self) -> Dict[str, int]:
         with self._cv:
@@ -315,15 +474,116 @@ class DroppingQueue:
             self._queue.clear()
 
 
-def _is_priority_message(message: str) -> bool:
+# Block-start markers. Plain substring tests: measured faster than re.search for literals.
+_TRACEBACK_START_MARKER = "Traceback (most recent call last):"
+_VALIDATION_START_MARKER = "Failed to validate prompt for output"
+
+
+def _error_signature(text: str) -> str:
+    """Stable error signature (sha256 hex); also persisted by HistoryStore."""
+    return hashlib.sha256(text.encode("utf-8", errors="ignore")).hexdigest()
+
+
+def _analyze(text: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """Run ErrorAnalyzer.analyze() and always return a (suggestion, metadata) pair.
+
+    Repeated errors reuse PatternMatcherStage's match cache; the rest of the
+    pipeline runs every time so context metadata reflects the current logs.
+    """
+    result = ErrorAnalyzer.analyze(text)
+    return result if result else (None, None)
+
+
+# detect_fatal_pattern() only inspects the start of a line (anchored markers),
+# so a bounded prefix is an exact cache key for repeated console lines.
+_FATAL_PATTERN_PREFIX = 256
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_fatal_pattern(prefix: str) -> Optional[str]:
+    return detect_fatal_pattern(prefix)
+
+
+def _fatal_pattern(message: str) -> Optional[str]:
+    """detect_fatal_pattern() with an LRU over the message prefix."""
+    if detect_fatal_pattern is None:
+        return None
+    return _cached_fatal_pattern(message[:_FATAL_PATTERN_PREFIX])
+
+
+# Producer-side capture filter. Outside an active traceback the processor only
+# acts on traceback/validation starts, tensor alerts and detect_fatal_pattern()
+# markers (ERROR:/CRITICAL:/RuntimeError:/OOM:/CUDA out of memory, any case).
+# Everything else is skipped at write() time instead of being queued.
+_CAPTURE_TRIGGER_RE = re.compile(
+    r"Traceback \(most recent call last\):|Failed to validate prompt for output"
+    r"|CRITICAL|Meta Tensor|ERROR|OOM|CUDA\s+out\s+of\s+memory",
+    re.IGNORECASE,
+)
+
+
+def _may_trigger_capture(lowered: str) -> bool:
+    """Substring gate in front of _CAPTURE_TRIGGER_RE for a lowercased line.
+
+    Every regex alternative contains one of these words, so a miss here is a
+    miss there; the IGNORECASE search costs microseconds per line, this an
+    order of magnitude less on ordinary progress output.
+    """
+    return (
+        "error" in lowered
+        or "oom" in lowered
+        or "critical" in lowered
+        or "memory" in lowered
+        or "traceback" in lowered
+        or "meta tensor" in lowered
+        or "failed to validate" in lowered
+    )
+
+
+# Monotonic deadline until which every write is queued after a trigger. Covers the
+# gap before DoctorLogProcessor picks up a traceback start and sets _TRACEBACK_ACTIVE.
+_capture_deadline = 0.0
+
+
+def _capture_priority(message: str) -> Optional[bool]:
+    """Classify a write for the queue: None to skip it, else its priority flag.
+
+    Lines are priority while a traceback is active or when they open a
+    traceback/validation block. Filtering and prioritising share one pass: a
+    line that misses _CAPTURE_TRIGGER_RE cannot contain a block-start marker.
+    """
+    global _capture_deadline
     if _TRACEBACK_ACTIVE.is_set():
         return True
-    if not message:
+    match = _CAPTURE_TRIGGER_RE.search(message) if _may_trigger_capture(message.lower()) else None
+    if match:
+        _capture_deadline = time.monotonic() + CONFIG.traceback_timeout_seconds
+        if match.group() in (_TRACEBACK_START_MARKER, _VALIDATION_START_MARKER):
+            return True
+        return _TRACEBACK_START_MARKER in message or _VALIDATION_START_MARKER in message
+    if time.monotonic() < _capture_deadline:
         return False
-    if "Traceback (most recent call last):" in message:
-        return True
-    if "Failed to validate prompt for output" in message:
-        return True
+    return None
+
+
+_NON_TERMINAL_LINE_PREFIXES = (" ", "\t", 'File "', "Traceback")
+# An exception line at the start of any line of a message; same shape as the
+# "\nXError: ..." line ErrorAnalyzer.is_complete_traceback looks for.
+_EXCEPTION_LINE_START_RE = re.compile(r"^[A-Z][a-zA-Z0-9]*(?:Error|Exception|Warning|Interrupt):", re.MULTILINE)
+
+
+def _maybe_terminal_line(message: str) -> bool:
+    """Cheap pre-check: can any line of this message complete a traceback?
+
+    Frame lines (`File "..."`, indented source/caret lines) and blank writes never
+    complete a traceback or validation block, so ErrorAnalyzer.is_complete_traceback
+    only needs to rescan the buffer when the message has an unindented line. Every
+    line counts, not just the last: exception messages may end in indented detail
+    (e.g. "Missing key(s) in state_dict" under a RuntimeError).
+    """
+    for line in message.split("\n"):
+        if line.strip() and not line.startswith(_NON_TERMINAL_LINE_PREFIXES):
+            return True
     return False
 
 
@@ -334,8 +594,9 @@ def _is_priority_message(message: str) -> bool:
 
 def get_last_analysis() -> Dict[str, Any]:
     """Get the last error analysis result for API access."""
-    with _history_lock:
-        return _last_analysis.copy()
+    # Lock-free read: writers only rebind _last_analysis (atomic) or set single
+    # keys, and dict.copy() runs in C without releasing the GIL.
+    return _last_analysis.copy()
 
 
 def update_resolution_status(timestamp: str, status: str) -> bool:
@@ -351,12 +612,16 @@ def update_resolution_status(timestamp: str, status: str) -> bool:
                     entry.resolution_status = status
                     updated = True
                     break
+            # Entries still queued for DoctorHistoryWriter are written with the new status.
+            writer = _history_writer
+            if writer is not None and writer.update_resolution_status(timestamp, status):
+                updated = True
             store._save()
     except Exception:
         pass
 
     with _history_lock:
-        global _last_analysis
+        global _last_analysis, _analysis_snapshot
         if _last_analysis.get("timestamp") == timestamp:
             _last_analysis["resolution_status"] = status
             updated = True
@@ -364,6 +629,7 @@ def update_resolution_status(timestamp: str, status: str) -> bool:
         for entry in _analysis_history:
             if entry.get("timestamp") == timestamp:
                 entry["resolution_status"] = status
+                _analysis_snapshot = None
                 updated = True
                 break
 
@@ -375,28 +641,48 @@ def get_analysis_history() -> List[Dict[str, Any]]:
     # Prefer persistent store, fallback to in-memory
     try:
         store = _get_history_store()
-        history = store.get_all()
+        writer = _history_writer
+        # Merge in entries DoctorHistoryWriter has not written yet. Taking the store
+        # lock first keeps a batch that is being written from being counted twice.
+        with store._lock:
+            history = store.get_all(writer.unwritten() if writer is not None else None)
         if history:
             return history
     except Exception:
         pass  # Fallback to in-memory
 
-    with _history_lock:
-        return list(reversed(_analysis_history))
+    global _analysis_snapshot
+    snapshot = _analysis_snapshot
+    if snapshot is None:
+        with _history_lock:
+            snapshot = _analysis_snapshot
+            if snapshot is None:
+                # Live entries are aggregated in place under the lock, so copy
+                # them here rather than after releasing it.
+                snapshot = _analysis_snapshot = tuple(dict(entry) for entry in reversed(_analysis_history))
+    # Fresh dicts per call so callers cannot modify the shared snapshot.
+    return [dict(entry) for entry in snapshot]
 
 
 def clear_analysis_history() -> bool:
     """Clear all history (both persistent and in-memory)."""
     success = True
     try:
-        store = _get_history_store()
-        store.clear()
+        writer = _history_writer
+        if writer is not None:
+            # Clears the store too, ordered against a batch the writer is saving.
+            writer.clear()
+        else:
+            _get_history_store().clear()
     except Exception:
         success = False
 
     with _history_lock:
+        global _last_analysis, _analysis_snapshot, _analysis_history_chars
         _analysis_history.clear()
-        global _last_analysis
+        _signature_index.clear()
+        _analysis_history_chars = 0
+        _analysis_snapshot = None
         _last_analysis = {
             "error": None,
             "suggestion": None,
@@ -431,6 +717,20 @@ def clear_analysis_history() -> bool:
 # New Architecture: SafeStreamWrapper + DoctorLogProcessor
 # ==============================================================================
 
+# Longest partial line SafeStreamWrapper holds back waiting for a newline.
+_RING_PENDING_MAX_CHARS = 4096
+# Ring buffer line ends: '\r' ends a progress-bar redraw the same way '\n' ends a line.
+_RING_LINE_BREAK_RE = re.compile(r"\r\n?|\n")
+
+
+def _discard_flush():
+    return None
+
+
+def _discard_write(data):
+    return 0
+
+
 class SafeStreamWrapper:
     """
     Safe stream wrapper that avoids deadlock with ComfyUI's LogInterceptor.
@@ -446,16 +746,30 @@ class SafeStreamWrapper:
     - Background thread is completely decoupled
     """
 
-    def __init__(self, original_stream, message_queue):
+    __slots__ = (
+        "_original_stream", "_queue", "_stream_write", "_queue_put", "_ring_buffer", "_ring_pending"
+    )
+
+    def __init__(self, original_stream, message_queue, ring_buffer=None):
         """
         Initialize wrapper.
 
         Args:
             original_stream: Original stream (may be LogInterceptor or raw stdout/stderr)
             message_queue: Queue for background processing
+            ring_buffer: R14 ring buffer receiving complete lines; when omitted the
+                global instance is looked up on each write, so the wrapper follows
+                reset_ring_buffer() (nothing is recorded if the service is unavailable)
         """
         self._original_stream = original_stream
         self._queue = message_queue
+        # Bind the hot-path methods once; write() runs for every line ComfyUI prints.
+        # The stream may be None (e.g. pythonw), so fall back to a no-op writer.
+        self._stream_write = getattr(original_stream, "write", _discard_write)
+        self._queue_put = message_queue.put_nowait
+        self._ring_buffer = ring_buffer
+        # Per-thread partial line awaiting its newline before it reaches the ring buffer.
+        self._ring_pending = threading.local()
 
     def write(self, data):
         """
@@ -467,47 +781,114 @@ class SafeStreamWrapper:
         # R22: Reentrance guard — if we are already inside a write() on this
         # thread (e.g. because _record_analysis triggered a logging call that
         # routes back here), skip the enqueue step to break the recursion.
-        if getattr(_stream_reentrance, "active", False):
+        # Non-text writes (bytes from a binary-capable interceptor) are passed
+        # through without capture: every marker check works on str and would
+        # otherwise raise and swallow a TypeError per chunk.
+        if not isinstance(data, str) or getattr(_stream_reentrance, "active", False):
             try:
-                self._original_stream.write(data)
+                self._stream_write(data)
             except (OSError, AttributeError, UnicodeError, ValueError):
                 pass
             return
 
         _stream_reentrance.active = True
+        priority = None
         try:
             # 1. Immediately write to original stream (may be LogInterceptor)
             try:
-                self._original_stream.write(data)
+                self._stream_write(data)
             except (OSError, AttributeError, UnicodeError, ValueError):
                 pass  # Stream may be closed during shutdown
 
-            # 2. Enqueue for background processing (non-blocking)
+            # 2. Enqueue for background processing (non-blocking); lines that
+            #    cannot start or continue an error are never queued.
             try:
-                priority = _is_priority_message(data)
-                self._queue.put_nowait(data, priority=priority)
+                priority = _capture_priority(data)
+                if priority is not None:
+                    self._queue_put(data, priority=priority)
             except Exception:
                 pass
         finally:
             _stream_reentrance.active = False
         
-        # R14: Add to ring buffer for reliable log context capture
+        # R14: Add to ring buffer for reliable log context capture. Error output
+        # (anything queued for analysis) is not held back: the processor reads
+        # the ring buffer for context as soon as the traceback completes.
         try:
-            if get_ring_buffer:
-                ring_buffer = get_ring_buffer()
-                ring_buffer.add_line(data)
+            ring_buffer = self._current_ring_buffer()
+            if ring_buffer is not None:
+                self._add_to_ring_buffer(ring_buffer, data, flush=priority is not None)
         except Exception:
             pass  # Never fail on ring buffer operations
 
+    def _current_ring_buffer(self):
+        """The injected ring buffer, else the current global one (None if unavailable)."""
+        if self._ring_buffer is not None:
+            return self._ring_buffer
+        return get_ring_buffer() if get_ring_buffer else None
+
+    def _add_to_ring_buffer(self, ring_buffer, data: str, flush: bool = False) -> None:
+        """
+        Hand complete lines to the ring buffer.
+
+        print() and logging emit a line as several writes; fragments are joined
+        per thread so each ring entry is one line and the buffer is touched once
+        per line rather than once per write. '\r' ends a line too, and with
+        flush=True the trailing partial line is added instead of held back.
+        """
+        pending = getattr(self._ring_pending, "text", "")
+        text = pending + data if pending else data
+        if "\n" in text or "\r" in text:
+            lines = _RING_LINE_BREAK_RE.split(text)
+            text = lines.pop()
+            ring_buffer.add_lines(lines)
+        if flush or len(text) > _RING_PENDING_MAX_CHARS:
+            # Newline-free output must not grow forever.
+            self._ring_pending.text = ""
+            if text:
+                ring_buffer.add_line(text)
+        else:
+            self._ring_pending.text = text
+
+    def _flush_ring_pending(self, ring_buffer) -> None:
+        """Add this thread's partial line to the ring buffer."""
+        text = getattr(self._ring_pending, "text", "")
+        if text:
+            self._ring_pending.text = ""
+            ring_buffer.add_line(text)
+
     def flush(self):
-        """Flush original stream."""
+        """Flush original stream and this thread's partial ring buffer line."""
+        try:
+            ring_buffer = self._current_ring_buffer()
+            if ring_buffer is not None:
+                self._flush_ring_pending(ring_buffer)
+        except Exception:
+            pass  # Never fail on ring buffer operations
         try:
             self._original_stream.flush()
         except (OSError, AttributeError, UnicodeError, ValueError):
             pass
 
+    # Frequently queried stream attributes are delegated explicitly so lookups skip
+    # the failed-lookup -> __getattr__ fallback. They stay live (not snapshotted),
+    # since the wrapped stream can be reconfigured after install.
+    @property
+    def encoding(self):
+        return self._original_stream.encoding
+
+    @property
+    def errors(self):
+        return self._original_stream.errors
+
+    def isatty(self):
+        return self._original_stream.isatty()
+
+    def fileno(self):
+        return self._original_stream.fileno()
+
     def __getattr__(self, name):
-        """Proxy all other attributes to original stream (encoding, isatty, fileno, etc)."""
+        """Proxy all other attributes to original stream (buffer, reconfigure, etc)."""
         return getattr(self._original_stream, name)
 
 
@@ -525,18 +906,23 @@ class FlushSafeProxy:
     It intentionally does NOT enqueue messages for Doctor analysis.
     """
 
+    __slots__ = ("_original_stream", "_stream_write", "_stream_flush")
+
     def __init__(self, original_stream):
         self._original_stream = original_stream
+        # Bound once: StreamHandler calls write() and flush() on every emit.
+        self._stream_write = getattr(original_stream, "write", _discard_write)
+        self._stream_flush = getattr(original_stream, "flush", _discard_flush)
 
     def write(self, data):
         try:
-            return self._original_stream.write(data)
+            return self._stream_write(data)
         except (OSError, AttributeError, UnicodeError, ValueError):
             return 0
 
     def flush(self):
         try:
-            return self._original_stream.flush()
+            return self._stream_flush()
         except (OSError, AttributeError, UnicodeError, ValueError):
             return None
 
@@ -584,6 +970,15 @@ class DoctorLogProcessor(threading.Thread):
         # Traceback buffer state (migrated from SmartLogger)
         self._buffer_lock = threading.RLock()
         self.buffer = []
+        # Lazily joined copy of self.buffer (None = stale). Appends stay O(1); the
+        # join happens only when a completion check or flush reads _buffer_text.
+        self._buffer_joined: Optional[str] = ""
+        # Set when any buffered line carries a validation failure; replaces
+        # re-scanning the whole buffer for "Failed to validate" on flush.
+        self._buffer_has_validate = False
+        # Length of _buffer_text already found incomplete; later completion
+        # checks only search the text appended since.
+        self._buffer_checked_len = 0
         self.in_traceback = False
         self.last_buffer_time = 0
         try:
@@ -595,41 +990,55 @@ class DoctorLogProcessor(threading.Thread):
         if self._aggregate_window_seconds <= 0:
             self._aggregate_window_seconds = 60
 
-    def _parse_ts(self, ts: str) -> datetime.datetime:
-        return parse_utc_timestamp(ts) or UTC_MIN
-
     def run(self):
         """Main loop: process queued messages."""
         while self._running:
             try:
-                # Use timeout to allow periodic buffer timeout checks
-                priority, message = self._queue.get(timeout=0.5)
-                self._process_message(message)
-
+                # Use timeout to allow periodic buffer timeout checks; drain whatever
+                # a burst has queued in one go instead of one wakeup per line.
+                batch = self._queue.get_batch(timeout=0.5)
             except queue.Empty:
                 # Timeout: check if buffer needs flushing
                 self._metrics["queue_timeouts"] += 1
                 self._check_buffer_timeout()
-
+                continue
             except Exception as e:
-                # Log error but don't crash the thread
                 logging.error(f"[Doctor] LogProcessor error: {e}", exc_info=True)
-
-    def _process_message(self, message):
+                continue
+
+            # One clock read and one lock acquisition per batch; timeouts are
+            # seconds, batches are milliseconds.
+            now = time.monotonic()
+            with self._buffer_lock:
+                for _priority, message in batch:
+                    try:
+                        self._process_message_locked(message, now)
+                    except Exception as e:
+                        # Log error but don't crash the thread
+                        logging.error(f"[Doctor] LogProcessor error: {e}", exc_info=True)
+
+    def _process_message(self, message, now: Optional[float] = None):
         with self._buffer_lock:
-            return self._process_message_locked(message)
+            return self._process_message_locked(message, now)
 
-    def _process_message_locked(self, message):
+    def _process_message_locked(self, message, now: Optional[float] = None):
         """
         Process a single message (migrated from SmartLogger._analyze_stream).
+
+        `now` is a time.monotonic() reading shared by the current drain batch.
         """
-        current_time = time.time()
+        # Outside a traceback, blank writes (print() emits its "\n" separately)
+        # cannot match any marker; drop them before any scanning.
+        if not self.in_traceback and (not message or message.isspace()):
+            return
+
+        current_time = time.monotonic() if now is None else now
 
         # Always check buffer timeout, even when logs keep coming.
         # In some environments (e.g., ComfyUI Desktop), periodic Doctor-API logs
         # can prevent queue.Empty from firing, which previously blocked buffer flush
         # for non-traceback errors like "Failed to validate prompt for output".
-        self._check_buffer_timeout()
+        self._check_buffer_timeout_locked(current_time)
 
         # ═══════════════════════════════════════════════════════════════
         # CRITICAL FIX (2026-01-06): Prevent recursive log capture
@@ -644,16 +1053,8 @@ class DoctorLogProcessor(threading.Thread):
         # DO NOT REMOVE THIS CHECK! It prevents infinite recursion.
         # See: .planning/260106-BUGFIX_DUPLICATE_LOG_CAPTURE.md
         # ═══════════════════════════════════════════════════════════════
-        doctor_markers = [
-            "[Doctor]",       # Internal logging prefix
-            "[Doctor-API]",   # API logging prefix
-            "----------------------------------------",  # Divider line
-        ]
-        doctor_markers.extend(_ASCII_DOCTOR_OUTPUT_MARKERS)
-        doctor_markers.extend(_LEGACY_DOCTOR_OUTPUT_MARKERS)
-        for marker in doctor_markers:
-            if marker in message:
-                return  # Skip Doctor's own output to prevent recursion
+        if _is_doctor_output(message):
+            return  # Skip Doctor's own output to prevent recursion
 
         # R22: Exclude asyncio transport GC warnings (Windows ProactorEventLoop)
         # These are non-actionable Python-internal warnings that cause recursive
@@ -666,47 +1067,38 @@ class DoctorLogProcessor(threading.Thread):
         is_urgent = _contains_tensor_alert(message)
         
         # R14: Check for fatal patterns (CUDA OOM, CRITICAL, etc.)
-        if not is_urgent and detect_fatal_pattern:
-            fatal_marker = detect_fatal_pattern(message)
+        if not is_urgent:
+            fatal_marker = _fatal_pattern(message)
             if fatal_marker:
                 is_urgent = True
-                logging.debug(f"[Doctor] R14 fatal pattern detected: {fatal_marker}")
+                logging.debug("[Doctor] R14 fatal pattern detected: %s", fatal_marker)
         
         if is_urgent and not self.in_traceback:
-            result = ErrorAnalyzer.analyze(message)
-            suggestion, metadata = result if result else (None, None)
-            if suggestion:
-                self._record_analysis(message, suggestion, metadata)
+            # Not in a traceback, so the validation flag is clear: this records only on a suggestion.
+            self._analyze_and_record(message, only_actionable=True)
             return
 
         # Detect traceback start
-        if "Traceback (most recent call last):" in message:
+        if _TRACEBACK_START_MARKER in message:
             self._set_traceback_state(True)
-            self.buffer = [message]
-            self.last_buffer_time = current_time
+            self._start_buffer(message, current_time)
             return
 
         # Handle validation errors
-        if "Failed to validate prompt for output" in message:
+        if _VALIDATION_START_MARKER in message:
             if not self.in_traceback:
                 self._set_traceback_state(True)
-                self.buffer = [message]
-                self.last_buffer_time = current_time
+                self._start_buffer(message, current_time)
             else:
-                self.buffer.append(message)
-                self.last_buffer_time = current_time
+                self._append_buffer(message, current_time)
             return
 
         if self.in_traceback:
             # Check timeout
             if current_time - self.last_buffer_time > CONFIG.traceback_timeout_seconds:
-                full_traceback = "".join(self.buffer)
-                result = ErrorAnalyzer.analyze(full_traceback)
-                suggestion, metadata = result if result else (None, None)
-                if suggestion or "Failed to validate" in full_traceback:
-                    self._record_analysis(full_traceback, suggestion, metadata)
+                self._analyze_and_record(self._buffer_text, only_actionable=True)
                 self._set_traceback_state(False)
-                self.buffer = []
+                self._clear_buffer()
             else:
                 # ═══════════════════════════════════════════════════════════════
                 # CRITICAL FIX (2026-01-06): Check completion marker BEFORE buffer.append()
@@ -721,53 +1113,104 @@ class DoctorLogProcessor(threading.Thread):
                 # DO NOT MOVE THIS CHECK AFTER buffer.append()!
                 # ═══════════════════════════════════════════════════════════════
                 if "Prompt executed" in message:
-                    full_traceback = "".join(self.buffer)
+                    full_traceback = self._buffer_text
                     if full_traceback.strip():  # Only record if buffer has content
-                        result = ErrorAnalyzer.analyze(full_traceback)
-                        suggestion, metadata = result if result else (None, None)
-                        self._record_analysis(full_traceback, suggestion, metadata)
+                        self._analyze_and_record(full_traceback)
                     self._set_traceback_state(False)
-                    self.buffer = []
+                    self._clear_buffer()
                     return
                 
-                self.buffer.append(message)
-                self.last_buffer_time = current_time
-                full_traceback = "".join(self.buffer)
-
-                # Normal traceback completion
-                if ErrorAnalyzer.is_complete_traceback(full_traceback):
-                    result = ErrorAnalyzer.analyze(full_traceback)
-                    suggestion, metadata = result if result else (None, None)
-                    self._record_analysis(full_traceback, suggestion, metadata)
+                self._append_buffer(message, current_time)
+
+                # Normal traceback completion.
+                if self._may_complete_buffer(message) and self._buffer_is_complete():
+                    self._analyze_and_record(self._buffer_text)
                     self._set_traceback_state(False)
-                    self.buffer = []
+                    self._clear_buffer()
 
                 # Buffer limit safety
                 elif len(self.buffer) > CONFIG.buffer_limit:
                     self._metrics["buffer_dropped"] += 1
                     self._metrics["traceback_resets"] += 1
                     self._set_traceback_state(False)
-                    self.buffer = []
+                    self._clear_buffer()
 
-    def _check_buffer_timeout(self):
-        """Check if buffer has timed out (called on queue.Empty)."""
+    def _check_buffer_timeout(self, now: Optional[float] = None):
+        """Check if buffer has timed out (called on queue.Empty and per message)."""
         with self._buffer_lock:
-            if self.in_traceback and self.buffer:
-                current_time = time.time()
-                if current_time - self.last_buffer_time > CONFIG.traceback_timeout_seconds:
-                    full_traceback = "".join(self.buffer)
-                    result = ErrorAnalyzer.analyze(full_traceback)
-                    suggestion, metadata = result if result else (None, None)
-                    if suggestion or "Failed to validate" in full_traceback:
-                        self._record_analysis(full_traceback, suggestion, metadata)
-                    self._metrics["traceback_resets"] += 1
-                    self._set_traceback_state(False)
-                    self.buffer = []
+            self._check_buffer_timeout_locked(time.monotonic() if now is None else now)
+
+    def _check_buffer_timeout_locked(self, now: float) -> None:
+        """_check_buffer_timeout() body; the caller holds _buffer_lock."""
+        if self.in_traceback and self.buffer:
+            if now - self.last_buffer_time > CONFIG.traceback_timeout_seconds:
+                self._analyze_and_record(self._buffer_text, only_actionable=True)
+                self._metrics["traceback_resets"] += 1
+                self._set_traceback_state(False)
+                self._clear_buffer()
+
+    def _analyze_and_record(self, text: str, only_actionable: bool = False) -> None:
+        """
+        Analyze text and record the result.
+
+        With only_actionable=True the entry is recorded only when a suggestion
+        matched or the buffered block is a prompt validation failure.
+        """
+        suggestion, metadata = _analyze(text)
+        if only_actionable and not (suggestion or self._buffer_has_validate):
+            return
+        self._record_analysis(text, suggestion, metadata, error_signature=_error_signature(text))
+
+    @property
+    def _buffer_text(self) -> str:
+        if self._buffer_joined is None:
+            self._buffer_joined = "".join(self.buffer)
+        return self._buffer_joined
+
+    def _may_complete_buffer(self, message: str) -> bool:
+        """Per-line pre-check: can appending message have completed the buffer?"""
+        # The opening message is never checked when the buffer starts, so always
+        # check on the first append.
+        if len(self.buffer) == 2:
+            return True
+        if self._buffer_has_validate:
+            return _maybe_terminal_line(message)
+        # Without a validation failure only an exception line ("XError: ...")
+        # completes the buffer. Checked per line, so a colon on an indented
+        # line next to a colon-free plain line does not trigger a rescan.
+        return _EXCEPTION_LINE_START_RE.search(message) is not None
+
+    def _buffer_is_complete(self) -> bool:
+        text = self._buffer_text
+        if ErrorAnalyzer.is_complete_traceback(text, self._buffer_checked_len):
+            return True
+        self._buffer_checked_len = len(text)
+        return False
+
+    def _start_buffer(self, message: str, current_time: float) -> None:
+        self.buffer = [message]
+        self._buffer_joined = message
+        self._buffer_has_validate = "Failed to validate" in message
+        self._buffer_checked_len = 0
+        self.last_buffer_time = current_time
+
+    def _append_buffer(self, message: str, current_time: float) -> None:
+        self.buffer.append(message)
+        self._buffer_joined = None
+        if not self._buffer_has_validate and "Failed to validate" in message:
+            self._buffer_has_validate = True
+        self.last_buffer_time = current_time
+
+    def _clear_buffer(self) -> None:
+        self.buffer = []
+        self._buffer_joined = ""
+        self._buffer_has_validate = False
+        self._buffer_checked_len = 0
 
     def reset_traceback_state(self) -> None:
         """Clear in-flight traceback assembly under the processor-owned lock."""
         with self._buffer_lock:
-            self.buffer = []
+            self._clear_buffer()
             self._set_traceback_state(False)
             self.last_buffer_time = 0
 
@@ -778,7 +1221,7 @@ class DoctorLogProcessor(threading.Thread):
         else:
             _TRACEBACK_ACTIVE.clear()
 
-    def _record_analysis(self, full_traceback, suggestion, metadata=None):
+    def _record_analysis(self, full_traceback, suggestion, metadata=None, error_signature=None):
         """
         Record analysis result (migrated from SmartLogger._record_analysis).
 
@@ -786,14 +1229,16 @@ class DoctorLogProcessor(threading.Thread):
             full_traceback: The full traceback string
             suggestion: Suggestion text (or None if no match)
             metadata: Optional metadata dict with pattern info (from F4)
+            error_signature: Precomputed _error_signature(full_traceback), if any
         """
         # R22: Use dedicated internal logger that bypasses SafeStreamWrapper
         # to prevent cross-contamination between Doctor's diagnostic output
         # and the captured exception text.
-        _doctor_internal_logger.debug(
-            "_record_analysis called with traceback preview: %s...",
-            full_traceback[:100] if full_traceback else "None",
-        )
+        if _doctor_internal_logger.isEnabledFor(logging.DEBUG):
+            _doctor_internal_logger.debug(
+                "_record_analysis called with traceback preview: %s...",
+                full_traceback[:100] if full_traceback else "None",
+            )
         
         # ═══════════════════════════════════════════════════════════════
         # CRITICAL FIX (2026-01-06): Prevent non-error messages from
@@ -832,36 +1277,23 @@ class DoctorLogProcessor(threading.Thread):
         
         # Explicit exclusion for normal execution messages
         # These messages should NEVER be recorded as errors
-        normal_messages = [
-            "Prompt executed in",
-            "got prompt",
-            "Executing node",
-            "To see the GUI go to:",
-            "Starting server",
-        ]
-        for normal_msg in normal_messages:
-            if normal_msg in full_traceback and "Error" not in full_traceback and "Exception" not in full_traceback:
-                logging.debug(f"[Doctor] Skipping normal message: {full_traceback[:100]}")
-                return
+        # (real errors nearly always mention Error/Exception, so test that first)
+        if (
+            "Error" not in full_traceback
+            and "Exception" not in full_traceback
+            and _contains_any(full_traceback, _NORMAL_MESSAGE_MARKERS)
+        ):
+            if logging.root.isEnabledFor(logging.DEBUG):
+                logging.debug("[Doctor] Skipping normal message: %s", full_traceback[:100])
+            return
         
         # Require at least one error indicator
-        error_indicators = [
-            "Traceback (most recent call last):",
-            "Error:",
-            "Error ",  # Catch RuntimeError, ValueError etc without colon
-            "Exception:",
-            "Exception ",
-            "Failed to validate",
-            "❌ CRITICAL",
-            "⚠️ Meta Tensor",
-            "CRITICAL: Tensor contains",
-            "WARNING: Meta Tensor",
-        ]
-        has_error_indicator = any(indicator in full_traceback for indicator in error_indicators)
+        has_error_indicator = _contains_any(full_traceback, _ERROR_INDICATOR_MARKERS)
         
         # Also accept if we have a valid suggestion (pattern matched)
         if not has_error_indicator and not suggestion:
-            logging.debug(f"[Doctor] Skipping non-error message (no indicators): {full_traceback[:100]}")
+            if logging.root.isEnabledFor(logging.DEBUG):
+                logging.debug("[Doctor] Skipping non-error message (no indicators): %s", full_traceback[:100])
             return
         
         analysis_metadata = metadata if isinstance(metadata, dict) else {}
@@ -869,9 +1301,18 @@ class DoctorLogProcessor(threading.Thread):
         pattern_category = analysis_metadata.get("pattern_category") or analysis_metadata.get("category")
         pattern_priority = analysis_metadata.get("pattern_priority") or analysis_metadata.get("priority")
 
+        # Only reached once the record/skip decision above has been made, so the
+        # regex-heavy node extraction never runs for messages we discard.
         node_context = ErrorAnalyzer.extract_node_context(full_traceback)
-        timestamp = utc_isoformat()
-        error_signature = hashlib.sha256(full_traceback.encode("utf-8", errors="ignore")).hexdigest()
+        node_context_dict = node_context.to_dict() if node_context else None
+        has_node_context = bool(node_context and node_context.is_valid())
+        # One clock read serves both the persisted ISO string and the epoch value
+        # used for aggregation (no format -> parse round-trip).
+        now_ts = utc_now()
+        now_epoch = now_ts.timestamp()
+        timestamp = utc_isoformat(now_ts)
+        if not error_signature:
+            error_signature = _error_signature(full_traceback)
 
         new_analysis = {
             "error": full_traceback,
@@ -881,7 +1322,7 @@ class DoctorLogProcessor(threading.Thread):
             "last_seen": timestamp,
             "repeat_count": 1,
             "error_signature": error_signature,
-            "node_context": node_context.to_dict() if node_context else None,
+            "node_context": node_context_dict,
             "analysis_metadata": analysis_metadata,
             "matched_pattern_id": matched_pattern_id,
             "pattern_category": pattern_category,
@@ -891,48 +1332,40 @@ class DoctorLogProcessor(threading.Thread):
 
         # R2: Thread-safe update of shared state
         with _history_lock:
-            global _last_analysis
+            global _last_analysis, _analysis_snapshot
             _last_analysis = new_analysis
             # Aggregate repeated identical errors within 60 seconds to avoid unbounded history growth.
             # NOTE: We still update _last_analysis every time so the UI reflects new occurrences.
             aggregated = False
             try:
-                now_ts = self._parse_ts(timestamp)
-                # Look back across recent history to find a matching signature in-window.
-                # Limit scan to keep cost bounded even when history is unbounded.
-                scan_limit = 50
-                hist_len = len(_analysis_history)
-                start_index = max(0, hist_len - scan_limit)
-                for i in range(hist_len - 1, start_index - 1, -1):
-                    existing = _analysis_history[i]
-                    if not isinstance(existing, dict):
-                        continue
-                    if existing.get("error_signature") != error_signature:
-                        continue
-                    last_seen_str = existing.get("last_seen") or existing.get("timestamp") or ""
-                    last_seen_ts = self._parse_ts(last_seen_str)
-                    if (now_ts - last_seen_ts).total_seconds() <= self._aggregate_window_seconds:
+                # Only the most recent entry with this signature can absorb the repeat.
+                indexed = _signature_index.get(error_signature)
+                if indexed is not None:
+                    existing, last_seen_epoch = indexed
+                    if now_epoch - last_seen_epoch <= self._aggregate_window_seconds:
+                        _signature_index[error_signature] = (existing, now_epoch)
                         existing["repeat_count"] = int(existing.get("repeat_count", 1) or 1) + 1
                         existing["last_seen"] = timestamp
                         # Keep first_seen stable
                         if not existing.get("first_seen"):
                             existing["first_seen"] = existing.get("timestamp") or timestamp
+                        _analysis_snapshot = None
                         aggregated = True
-                    break
             except Exception:
                 pass
 
             if not aggregated:
-                _analysis_history.append(new_analysis.copy())
+                # Share the dict with _last_analysis: it is only ever rebound, and the
+                # one in-place writer (update_resolution_status) updates both anyway.
+                _append_history_entry(new_analysis, now_epoch)
 
-        # F1: Persist to history store
+        # F1: Persist to history store (off-thread when the writer is running)
         try:
-            store = _get_history_store()
             entry = HistoryEntry(
                 timestamp=timestamp,
                 error=full_traceback,
                 suggestion=suggestion if suggestion else {},
-                node_context=node_context.to_dict() if node_context else None,
+                node_context=node_context_dict,
                 matched_pattern_id=matched_pattern_id,
                 pattern_category=pattern_category,
                 pattern_priority=pattern_priority,
@@ -943,31 +1376,29 @@ class DoctorLogProcessor(threading.Thread):
                 last_seen=timestamp,
                 error_signature=error_signature,
             )
-            store.append(entry)
+            _persist_history_entry(entry)
         except Exception:
             pass  # Persistence failure should not break error analysis
 
-        # Only print if we have something useful (context OR suggestion)
-        if not suggestion and (not node_context or not node_context.is_valid()):
+        # Only print if we have something useful (context OR suggestion).
+        # This gates console output only: unmatched errors are still kept in
+        # history above so the UI and LLM chat can analyse them.
+        if not suggestion and not has_node_context:
             return
 
         # Build formatted output
-        output_parts = []
-        output_parts.append(f"\n{'-'*40}")
+        output_parts = [_OUTPUT_HEADER]
 
         # Add node context if available
-        if node_context and node_context.is_valid():
-            node_info = []
-            if node_context.node_id:
-                node_info.append(f"Node ID: #{node_context.node_id}")
-            if node_context.node_name:
-                node_info.append(f"Name: {node_context.node_name}")
-            if node_context.node_class:
-                node_info.append(f"Class: {node_context.node_class}")
-            if node_context.custom_node_path:
-                node_info.append(f"Source: {node_context.custom_node_path}")
-
-            output_parts.append("ERROR LOCATION: " + " | ".join(node_info))
+        if has_node_context:
+            fields = (
+                ("Node ID: #", node_context.node_id),
+                ("Name: ", node_context.node_name),
+                ("Class: ", node_context.node_class),
+                ("Source: ", node_context.custom_node_path),
+            )
+            node_info = [label + str(value) for label, value in fields if value]
+            output_parts.append(_ERROR_LOCATION_PREFIX + " | ".join(node_info))
 
         # Add suggestion (defensive: ensure suggestion is a string)
         if suggestion:
@@ -978,13 +1409,20 @@ class DoctorLogProcessor(threading.Thread):
                 normalized = str(suggestion[0]) if suggestion[0] else ""
                 output_parts.append(_normalize_backend_suggestion(normalized))
 
-        output_parts.append(f"{'-'*40}\n")
+        output_parts.append(_OUTPUT_FOOTER)
 
-        formatted_output = "\n".join(output_parts)
+        # Trailing newline included so the block goes out in one write().
+        formatted_output = "\n".join(output_parts) + "\n"
 
         # Print to stdout (will be captured by our wrapper and ComfyUI's LogInterceptor)
         try:
-            print(formatted_output, file=sys.__stdout__)
+            stdout = sys.__stdout__
+            # If something re-pointed __stdout__ at our wrapper, write past it so
+            # the block is not queued back into Doctor's own analysis.
+            if isinstance(stdout, SafeStreamWrapper):
+                stdout = stdout._original_stream
+            stdout.write(formatted_output)
+            stdout.flush()
         except (OSError, AttributeError, UnicodeError, ValueError):
             pass  # Silently fail if stdout is unavailable
 
@@ -993,6 +1431,157 @@ class DoctorLogProcessor(threading.Thread):
         self._running = False
 
 
+class DoctorHistoryWriter(threading.Thread):
+    """
+    Background thread that persists HistoryEntry records.
+
+    HistoryStore.append() serializes the whole history to JSON and fsyncs it;
+    running that here keeps bursts of recorded errors from stalling
+    DoctorLogProcessor. Entries are written in submission order, and bursts are
+    coalesced into a single HistoryStore.append_many() rewrite.
+
+    Entries that are queued or in the batch being written are tracked, and
+    get_analysis_history() / update_resolution_status() see them as if they were
+    already in the store, so API reads do not depend on how far behind the
+    writer is.
+
+    The pending queue is bounded: if the disk stalls during an error storm,
+    further entries are dropped (and counted) instead of piling up in memory.
+    Dropped entries, and entries whose write failed, are never saved to disk;
+    the most recent _MAX_PENDING of them stay visible in reads for the rest of
+    the session.
+    """
+
+    _STOP = object()
+    _MAX_BATCH = 32
+    _MAX_PENDING = 1024
+
+    def __init__(self, maxsize: int = _MAX_PENDING):
+        super().__init__(daemon=True, name="DoctorHistoryWriter")
+        self._queue = queue.Queue(maxsize=maxsize)
+        self.dropped = 0
+        # Guards the bookkeeping below; never held across disk I/O.
+        self._lock = threading.Lock()
+        # Submitted entries not in the store yet, oldest first.
+        self._unwritten = deque()
+        # Entries that will not be saved (dropped or failed to write), newest kept.
+        self._unsaved = deque(maxlen=self._MAX_PENDING)
+        # Bumped by clear() so a batch taken off the queue before a clear is not
+        # written back after it.
+        self._generation = 0
+
+    def submit(self, entry: HistoryEntry) -> None:
+        with self._lock:
+            try:
+                self._queue.put_nowait((self._generation, entry))
+            except queue.Full:
+                self.dropped += 1
+                self._unsaved.append(entry)
+            else:
+                self._unwritten.append(entry)
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def unwritten(self) -> List[HistoryEntry]:
+        """Entries submitted but not in the history store, oldest first."""
+        with self._lock:
+            if not self._unsaved:
+                return list(self._unwritten)
+            entries = list(self._unsaved) + list(self._unwritten)
+        # ISO timestamps sort chronologically; the sort is stable for ties.
+        entries.sort(key=lambda entry: entry.timestamp)
+        return entries
+
+    def update_resolution_status(self, timestamp: str, status: str) -> bool:
+        """Set the resolution status of unwritten entries with this timestamp."""
+        updated = False
+        with self._lock:
+            for entry in (*self._unsaved, *self._unwritten):
+                if entry.timestamp == timestamp:
+                    entry.resolution_status = status
+                    updated = True
+        return updated
+
+    def run(self):
+        while True:
+            # Coalesce a burst of entries into one HistoryStore rewrite.
+            batch = [self._queue.get()]
+            while len(batch) < self._MAX_BATCH and batch[-1] is not self._STOP:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = batch[-1] is self._STOP
+            items = batch[:-1] if stopping else batch
+            if items:
+                self._write(items)
+            if stopping:
+                return
+
+    def _write(self, items: List[Tuple[int, HistoryEntry]]) -> None:
+        try:
+            store = _get_history_store()
+            # Holding the store lock across the write and the bookkeeping keeps
+            # readers from seeing an entry both in the store and unwritten, and
+            # orders the write strictly before or after a clear().
+            with store._lock:
+                with self._lock:
+                    entries = [entry for generation, entry in items if generation == self._generation]
+                if not entries:
+                    return
+                saved = False
+                try:
+                    store.append_many(entries)
+                    saved = True
+                finally:
+                    with self._lock:
+                        # This batch holds the oldest unwritten entries.
+                        for _ in entries:
+                            self._unwritten.popleft()
+                        if not saved:
+                            self._unsaved.extend(entries)
+        except Exception:
+            pass  # Persistence failure should not break error analysis
+
+    def clear(self) -> None:
+        """Drop entries that have not been written yet and clear the history store."""
+        store = _get_history_store()
+        # Waits for a batch being written; a batch already taken off the queue
+        # is discarded by the generation check in _write().
+        with store._lock:
+            with self._lock:
+                self._generation += 1
+                self._unwritten.clear()
+                self._unsaved.clear()
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is self._STOP:
+                        # Keep a pending shutdown request intact.
+                        self._queue.put_nowait(item)
+                        break
+            store.clear()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Write out pending entries, then stop the thread."""
+        try:
+            self._queue.put(self._STOP, timeout=timeout)
+        except queue.Full:
+            pass  # Writer is stuck on disk; the daemon thread dies with the process
+        self.join(timeout=timeout)
+
+
+def _persist_history_entry(entry: HistoryEntry) -> None:
+    writer = _history_writer
+    if writer is not None and writer.is_alive():
+        writer.submit(entry)
+    else:
+        _get_history_store().append(entry)
+
+
 # ==============================================================================
 # Installation API (preserved interface, new implementation)
 # ==============================================================================
@@ -1000,6 +1589,7 @@ class DoctorLogProcessor(threading.Thread):
 # Global state for installation
 _message_queue = None
 _log_processor = None
+_history_writer = None
 _original_stdout = None
 _original_stderr = None
 
@@ -1012,13 +1602,13 @@ def install(log_path: str):
         log_path: Log file path (currently unused, kept for API compatibility)
 
     Architecture:
-    - Creates message queue and background processor thread
+    - Creates message queue, background processor and history writer threads
     - Wraps sys.stdout/stderr with SafeStreamWrapper
     - Background thread handles all error analysis
 
     Note: This completely avoids the on_flush callback issues from v1.2.x
     """
-    global _message_queue, _log_processor, _original_stdout, _original_stderr
+    global _message_queue, _log_processor, _history_writer, _original_stdout, _original_stderr
 
     # IMPORTANT: do a clean reinstall instead of skipping outright. Tests,
     # hot-reload, or interrupted teardown can leave the global logger state
@@ -1030,7 +1620,9 @@ def install(log_path: str):
             pass
         uninstall()
 
-    # Create queue and background processor
+    # Create queue, background processor and history writer
+    _history_writer = DoctorHistoryWriter()
+    _history_writer.start()
     _message_queue = DroppingQueue(maxsize=CONFIG.log_queue_maxsize)
     _log_processor = DoctorLogProcessor(_message_queue)
     _log_processor.start()
@@ -1039,7 +1631,8 @@ def install(log_path: str):
     _original_stdout = sys.stdout
     _original_stderr = sys.stderr
 
-    # Wrap stdout/stderr
+    # Wrap stdout/stderr; both feed the global R14 ring buffer, looked up per
+    # write so reset_ring_buffer() takes effect without a reinstall.
     sys.stdout = SafeStreamWrapper(_original_stdout, _message_queue)
     sys.stderr = SafeStreamWrapper(_original_stderr, _message_queue)
 
@@ -1059,13 +1652,14 @@ def install(log_path: str):
         pass
 
     logging.info("[Doctor] Logger installed (SafeStreamWrapper mode)")
-    logging.info(f"[Doctor] Original stdout type: {type(_original_stdout).__name__}")
-    logging.info(f"[Doctor] Original stderr type: {type(_original_stderr).__name__}")
+    if logging.root.isEnabledFor(logging.INFO):
+        logging.info("[Doctor] Original stdout type: %s", type(_original_stdout).__name__)
+        logging.info("[Doctor] Original stderr type: %s", type(_original_stderr).__name__)
 
 
 def uninstall():
     """Uninstall logger and restore original streams."""
-    global _log_processor, _original_stdout, _original_stderr, _message_queue
+    global _log_processor, _history_writer, _original_stdout, _original_stderr, _message_queue
 
     # Restore streams first so shutdown logging cannot recurse through wrappers.
     if _original_stdout is not None:
@@ -1079,6 +1673,11 @@ def uninstall():
         _log_processor.join(timeout=2.0)
         _log_processor = None
 
+    # Stop the writer after the processor so its last records still get persisted
+    if _history_writer:
+        _history_writer.stop(timeout=2.0)
+        _history_writer = None
+
     # Clear queue
     if _message_queue:
         _message_queue.clear()
@@ -1100,6 +1699,8 @@ def get_logger_metrics() -> Dict[str, Any]:
         "buffer_dropped": 0,
         "traceback_resets": 0,
         "queue_timeouts": 0,
+        "history_write_pending": 0,
+        "history_write_dropped": 0,
     }
 
     if _message_queue:
@@ -1109,6 +1710,15 @@ def get_logger_metrics() -> Dict[str, Any]:
     if _log_processor:
         metrics.update(_log_processor._metrics)
 
+    # Back-pressure of the persistence queue behind DoctorHistoryWriter
+    if _history_writer:
+        metrics["history_write_pending"] = _history_writer.pending()
+        metrics["history_write_dropped"] = _history_writer.dropped
+
+    fatal_cache = _cached_fatal_pattern.cache_info()
+    metrics["fatal_cache_hits"] = fatal_cache.hits
+    metrics["fatal_cache_misses"] = fatal_cache.misses
+
     return metrics
 
 
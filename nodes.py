@@ -1,6 +1,7 @@
 
 import torch
 import math
+import numbers
 
 class AnyType(str):
     """A special type that compares equal to any other type. 
@@ -120,53 +121,94 @@ class DebugPrintNode:
             return
 
         # --- Base Case: Primitives ---
-        print(f"{indent}Value: {str(data)[:200]}")
+        # Text is sliced before formatting; other objects (upscale models,
+        # samplers, ...) can have multi-MB reprs, so only name them. Numeric
+        # scalars (numpy.int64, Decimal, ...) and objects that unwrap to one
+        # via .item() print their value.
+        if isinstance(data, (str, bytes)):
+            print(f"{indent}Value: {data[:200]}")
+        elif data is None or isinstance(data, numbers.Number):
+            print(f"{indent}Value: {data}")
+        else:
+            value = self._scalar_item(data)
+            if isinstance(value, numbers.Number):
+                print(f"{indent}Value: {value}")
+            else:
+                print(f"{indent}Value: <{type(data).__name__} at 0x{id(data):x}>")
+
+    @staticmethod
+    def _scalar_item(data):
+        item = getattr(data, "item", None)
+        if not callable(item):
+            return None
+        try:
+            return item()
+        except Exception:
+            return None  # e.g. numpy arrays with more than one element
 
 
     def _inspect_tensor(self, data, indent):
-        print(f"{indent}Type: Tensor")
-        print(f"{indent}Shape: {data.shape}")
-        print(f"{indent}Dtype: {data.dtype}")
-        print(f"{indent}Device: {data.device}")
+        # One print per tensor: every write is a separate capture/analysis
+        # step for the Doctor logger, and one block cannot interleave with
+        # other threads' output. Lines gathered before an error still print.
+        lines = []
+        try:
+            self._describe_tensor(data, indent, lines)
+        finally:
+            print("\n".join(lines))
+
+    def _describe_tensor(self, data, indent, lines):
+        lines.append(f"{indent}Type: Tensor")
+        lines.append(f"{indent}Shape: {data.shape}")
+        lines.append(f"{indent}Dtype: {data.dtype}")
+        lines.append(f"{indent}Device: {data.device}")
         
         # Critical Checks
         if data.is_meta:
-            print(f"{indent}WARNING: Meta Tensor (No data)")
+            lines.append(f"{indent}WARNING: Meta Tensor (No data)")
             return
             
         if hasattr(data, "requires_grad") and data.requires_grad:
-            print(f"{indent}WARNING: requires_grad=True (might waste VRAM/time if not training)")
+            lines.append(f"{indent}WARNING: requires_grad=True (might waste VRAM/time if not training)")
 
         # Stats
         if data.numel() > 0:
-            # Check for NaN/Inf (torch.isnan/isinf work on GPU)
-            has_nan = torch.isnan(data).any().item()
-            has_inf = torch.isinf(data).any().item()
+            # Check for NaN/Inf (torch.isfinite works on GPU). One full pass and
+            # one device sync in the common all-finite case; NaN and Inf are
+            # only told apart once something non-finite was found.
+            has_nan = has_inf = False
+            if not torch.isfinite(data).all().item():
+                has_nan = torch.isnan(data).any().item()
+                has_inf = torch.isinf(data).any().item()
             
             if has_nan:
-                print(f"{indent}CRITICAL: Tensor contains NaN (Not a Number)!")
+                lines.append(f"{indent}CRITICAL: Tensor contains NaN (Not a Number)!")
             if has_inf:
-                print(f"{indent}CRITICAL: Tensor contains Inf (Infinity)!")
+                lines.append(f"{indent}CRITICAL: Tensor contains Inf (Infinity)!")
                 
             if not has_nan and not has_inf:
                 # Only calc stats if safe
                 try:
-                    # P3 optimization: use view + contiguous to avoid full copy
+                    # P3 optimization: reshape is a view for contiguous tensors
+                    # (no copy); permuted/strided ones are copied instead of
+                    # failing as view(-1) did. Reductions take the slice as is.
+                    flat = data.reshape(-1)
                     numel = data.numel()
                     if numel > 100000:
-                        # Use first 10k elements via view (no copy until .contiguous())
-                        sample = data.view(-1)[:10000].contiguous()
+                        sample = flat[:10000]
                         sample_label = "First 10k"
                     else:
-                        sample = data.view(-1)
+                        sample = flat
                         sample_label = "All"
                          
-                    d_min = sample.min().item()
-                    d_max = sample.max().item()
-                    d_mean = sample.float().mean().item()  # Cast to float for mean
-                    print(f"{indent}Stats ({sample_label}): Min={d_min:.4f}, Max={d_max:.4f}, Mean={d_mean:.4f}")
+                    # Min/max stay in the tensor's dtype (a float32 cast would round
+                    # int64/float64 extremes) and come back in one transfer;
+                    # only the mean needs the float cast.
+                    d_min, d_max = torch.stack((sample.min(), sample.max())).tolist()
+                    d_mean = sample.float().mean().item()
+                    lines.append(f"{indent}Stats ({sample_label}): Min={d_min:.4f}, Max={d_max:.4f}, Mean={d_mean:.4f}")
                 except Exception:
-                    print(f"{indent}Stats: Could not calculate (Error)")
+                    lines.append(f"{indent}Stats: Could not calculate (Error)")
 
 # Node Registration
 NODE_CLASS_MAPPINGS = {
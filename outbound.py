@@ -44,6 +44,10 @@ def sanitize_outbound_payload(payload: Any, sanitizer: PIISanitizer) -> Any:
     """
     Recursively sanitize all string values in the outbound payload.
     Leaves non-strings (numbers/bools/etc) intact.
+
+    Nested dicts/lists are rebuilt with an explicit stack rather than recursion,
+    so deeply nested workflow JSON cannot hit the interpreter recursion limit.
+    The input payload is never modified.
     """
     if sanitizer.level == SanitizationLevel.NONE:
         return payload
@@ -51,13 +55,26 @@ def sanitize_outbound_payload(payload: Any, sanitizer: PIISanitizer) -> Any:
     if isinstance(payload, str):
         return sanitizer.sanitize(payload).sanitized_text
 
-    if isinstance(payload, dict):
-        sanitized_dict: Dict[str, Any] = {}
-        for key, value in payload.items():
-            sanitized_dict[key] = sanitize_outbound_payload(value, sanitizer)
-        return sanitized_dict
-
-    if isinstance(payload, list):
-        return [sanitize_outbound_payload(item, sanitizer) for item in payload]
+    if not isinstance(payload, (dict, list)):
+        return payload
 
-    return payload
+    sanitize = sanitizer.sanitize
+    root: Any = {} if isinstance(payload, dict) else [None] * len(payload)
+    stack = [(payload, root)]
+    while stack:
+        source, target = stack.pop()
+        items = source.items() if isinstance(source, dict) else enumerate(source)
+        for key, value in items:
+            if isinstance(value, str):
+                target[key] = sanitize(value).sanitized_text
+            elif isinstance(value, dict):
+                child: Any = {}
+                target[key] = child
+                stack.append((value, child))
+            elif isinstance(value, list):
+                child = [None] * len(value)
+                target[key] = child
+                stack.append((value, child))
+            else:
+                target[key] = value
+    return root
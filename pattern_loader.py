@@ -18,10 +18,12 @@ Usage:
         error_key, captured_groups = result
 """
 
+import itertools
 import json
 import re
 import os
 import logging
+from collections import Counter
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 
@@ -33,6 +35,16 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Pattern schema: fields every pattern must define and the allowed categories
+_REQUIRED_PATTERN_FIELDS = frozenset({"id", "regex", "error_key", "priority", "category"})
+_VALID_CATEGORIES = frozenset({
+    "memory", "model_loading", "custom_nodes",
+    "framework", "workflow", "data_type", "generic"
+})
+
+# Process-wide so a fresh loader (reset_pattern_loader) never reuses a value
+_load_generations = itertools.count(1)
+
 
 class PatternLoader:
     """
@@ -56,27 +68,17 @@ class PatternLoader:
         """
         self.pattern_dirs = [Path(d) for d in pattern_dirs]
         self.patterns: List[Dict] = []
-        self.compiled_patterns: List[Tuple[re.Pattern, str, bool, int]] = []
-        self._file_mtimes: Dict[Path, float] = {}
-
-    def get_pattern_info(self, pattern_id: str) -> Optional[Dict]:
-        """
-        Get full metadata for a pattern by ID.
-
-        Args:
-            pattern_id: The ID of the pattern to look up
-
-        Returns:
-            Dictionary with pattern metadata (id, category, priority) or None if not found
-        """
-        for pattern in self.patterns:
-            if pattern.get("id") == pattern_id:
-                return {
-                    "id": pattern.get("id"),
-                    "category": pattern.get("category"),
-                    "priority": pattern.get("priority")
-                }
-        return None
+        # (compiled, error_key, has_groups, priority) in match order. Rebuilt
+        # as a new tuple on load() so a concurrent match() sees one full set.
+        self.compiled_patterns: Tuple[Tuple[re.Pattern, str, bool, int], ...] = ()
+        # id and error_key -> pattern dict; the first pattern in priority
+        # order claims a key, matching the old linear scan.
+        self._pattern_index: Dict[str, Dict] = {}
+        # Changes on every load(); callers caching match results key on it.
+        self.generation = 0
+        # Keyed by str path so reload_if_changed() can poll via os.scandir
+        # without building a Path per entry.
+        self._file_mtimes: Dict[str, float] = {}
 
     def load(self, validate_schema: bool = True) -> int:
         """
@@ -109,7 +111,7 @@ class PatternLoader:
                         self._validate_schema(data, json_file)
 
                     # Track file modification time for hot-reload
-                    self._file_mtimes[json_file] = json_file.stat().st_mtime
+                    self._file_mtimes[str(json_file)] = json_file.stat().st_mtime
 
                     # Add patterns with source tracking
                     for pattern in data.get("patterns", []):
@@ -127,13 +129,12 @@ class PatternLoader:
         all_patterns.sort(key=lambda p: p.get("priority", 50), reverse=True)
 
         # Compile regex patterns
-        self.patterns = all_patterns
-        self.compiled_patterns = []
+        compiled_patterns = []
 
         for pattern in all_patterns:
             try:
                 compiled = re.compile(pattern["regex"])
-                self.compiled_patterns.append((
+                compiled_patterns.append((
                     compiled,
                     pattern["error_key"],
                     pattern.get("has_groups", False),
@@ -142,6 +143,16 @@ class PatternLoader:
             except re.error as e:
                 logger.error(f"[PatternLoader] Invalid regex in pattern '{pattern.get('id', 'unknown')}': {e}")
 
+        pattern_index: Dict[str, Dict] = {}
+        for pattern in all_patterns:
+            for key in (pattern.get("id"), pattern.get("error_key")):
+                if key is not None:
+                    pattern_index.setdefault(key, pattern)
+
+        self.patterns = all_patterns
+        self.compiled_patterns = tuple(compiled_patterns)
+        self._pattern_index = pattern_index
+        self.generation = next(_load_generations)
         logger.info(f"[PatternLoader] Total patterns loaded: {len(self.compiled_patterns)}")
         return len(self.compiled_patterns)
 
@@ -166,8 +177,7 @@ class PatternLoader:
         seen_ids = set()
         for i, pattern in enumerate(data["patterns"]):
             # Required fields
-            required = {"id", "regex", "error_key", "priority", "category"}
-            missing = required - set(pattern.keys())
+            missing = _REQUIRED_PATTERN_FIELDS - pattern.keys()
             if missing:
                 raise ValueError(f"Pattern #{i} in {filepath} missing fields: {missing}")
 
@@ -183,11 +193,7 @@ class PatternLoader:
                 raise ValueError(f"Pattern '{pattern_id}' priority {priority} out of range [0, 100]")
 
             # Valid category
-            valid_categories = {
-                "memory", "model_loading", "custom_nodes",
-                "framework", "workflow", "data_type", "generic"
-            }
-            if pattern["category"] not in valid_categories:
+            if pattern["category"] not in _VALID_CATEGORIES:
                 raise ValueError(f"Pattern '{pattern_id}' has invalid category '{pattern['category']}'")
 
     def reload_if_changed(self) -> bool:
@@ -200,17 +206,29 @@ class PatternLoader:
         changed = False
 
         for pattern_dir in self.pattern_dirs:
-            if not pattern_dir.exists():
+            try:
+                entries = os.scandir(pattern_dir)
+            except OSError:
                 continue
 
-            for json_file in pattern_dir.glob("*.json"):
-                try:
-                    current_mtime = json_file.stat().st_mtime
-                    if json_file not in self._file_mtimes or current_mtime > self._file_mtimes[json_file]:
-                        changed = True
-                        break
-                except Exception as e:
-                    logger.warning(f"[PatternLoader] Error checking {json_file}: {e}")
+            with entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        # is_file() comes from the listing; one stat per entry
+                        current_mtime = entry.stat().st_mtime
+                        known_mtime = self._file_mtimes.get(entry.path)
+                        if known_mtime is None or current_mtime > known_mtime:
+                            changed = True
+                            break
+                    except OSError as e:
+                        logger.warning(f"[PatternLoader] Error checking {entry.path}: {e}")
+
+            if changed:
+                break
 
         if changed:
             logger.info("[PatternLoader] Pattern files changed, reloading...")
@@ -229,6 +247,9 @@ class PatternLoader:
         Returns:
             Tuple of (error_key, captured_groups) or None if no match
         """
+        if not traceback_text:
+            return None
+
         for compiled, error_key, has_groups, _ in self.compiled_patterns:
             match = compiled.search(traceback_text)
             if match:
@@ -243,16 +264,13 @@ class PatternLoader:
         Get full pattern metadata for a given pattern ID.
         
         Args:
-            pattern_id: The pattern ID (error_key) to look up
+            pattern_id: The pattern error_key or id to look up
         
         Returns:
             Dictionary with pattern metadata (id, category, priority, regex, etc.),
             or None if pattern not found
         """
-        for pattern in self.patterns:
-            if pattern.get("error_key") == pattern_id or pattern.get("id") == pattern_id:
-                return pattern
-        return None
+        return self._pattern_index.get(pattern_id)
 
     def get_stats(self) -> Dict:
         """
@@ -267,31 +285,24 @@ class PatternLoader:
                 "sources": ["builtin.json", ...]
             }
         """
-        by_category = {}
+        patterns = self.patterns
+        by_category = Counter(p.get("category", "generic") for p in patterns)
+
+        # Priority buckets: high >= 80, medium >= 50, low otherwise
         by_priority = {"high": 0, "medium": 0, "low": 0}
-        sources = set()
-
-        for pattern in self.patterns:
-            # Category count
-            category = pattern.get("category", "generic")
-            by_category[category] = by_category.get(category, 0) + 1
-
-            # Priority buckets
-            priority = pattern.get("priority", 50)
-            if priority >= 80:
-                by_priority["high"] += 1
-            elif priority >= 50:
-                by_priority["medium"] += 1
+        for value, count in Counter(p.get("priority", 50) for p in patterns).items():
+            if value >= 80:
+                by_priority["high"] += count
+            elif value >= 50:
+                by_priority["medium"] += count
             else:
-                by_priority["low"] += 1
+                by_priority["low"] += count
 
-            # Source files
-            if "_source" in pattern:
-                sources.add(Path(pattern["_source"]).name)
+        sources = {os.path.basename(p["_source"]) for p in patterns if "_source" in p}
 
         return {
             "total": len(self.patterns),
-            "by_category": by_category,
+            "by_category": dict(by_category),
             "by_priority": by_priority,
             "sources": sorted(sources)
         }
@@ -35,25 +35,30 @@ MAX_NESTED_DEPTH = 5
 
 
 def _has_allowed_prefix(key: str) -> bool:
-    return any(key.startswith(prefix) for prefix in ALLOWED_PREFIXES)
+    return key.startswith(ALLOWED_PREFIXES)
 
 
 def _exceeds_limits(value: Any, depth: int = 0) -> bool:
-    if depth > MAX_NESTED_DEPTH:
-        return True
-
-    if isinstance(value, str):
-        return len(value) > MAX_STRING_LENGTH
-
-    if isinstance(value, list):
-        if len(value) > MAX_LIST_ITEMS:
+    # Iterative walk: one frame regardless of nesting
+    stack = [(value, depth)]
+    while stack:
+        value, depth = stack.pop()
+        if depth > MAX_NESTED_DEPTH:
             return True
-        return any(_exceeds_limits(item, depth + 1) for item in value)
 
-    if isinstance(value, dict):
-        if len(value) > MAX_NESTED_KEYS:
-            return True
-        return any(_exceeds_limits(item, depth + 1) for item in value.values())
+        if isinstance(value, str):
+            if len(value) > MAX_STRING_LENGTH:
+                return True
+        elif isinstance(value, list):
+            if len(value) > MAX_LIST_ITEMS:
+                return True
+            depth += 1
+            stack.extend((item, depth) for item in value)
+        elif isinstance(value, dict):
+            if len(value) > MAX_NESTED_KEYS:
+                return True
+            depth += 1
+            stack.extend((item, depth) for item in value.values())
 
     return False
 
@@ -98,11 +103,11 @@ def validate_metadata_contract(metadata: Dict[str, Any]) -> Dict[str, Any]:
         if key in {"metadata_schema_version", "pipeline_status", "stage_errors", "_invalid"}:
             continue
 
-        if not (key in ALLOWED_KEYS or _has_allowed_prefix(key)):
+        expected_type = ALLOWED_KEYS.get(key)
+        if expected_type is None and not _has_allowed_prefix(key):
             invalid[key] = value
             continue
 
-        expected_type = ALLOWED_KEYS.get(key)
         if expected_type and not isinstance(value, expected_type):
             invalid[key] = value
             continue
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple
 import logging
 import traceback
 from .base import PipelineStage
@@ -22,6 +22,8 @@ class AnalysisPipeline:
         """
         self.stages = stages
         self._validate_stages()
+        # (stage, name, stage_id, parsed requires) resolved once per pipeline
+        self._stage_plan = tuple(self._plan_stage(stage) for stage in self.stages)
         
     def _validate_stages(self):
         """Ensure all stages implement the PipelineStage protocol."""
@@ -44,12 +46,8 @@ class AnalysisPipeline:
         if pipeline_status not in {"ok", "degraded", "failed"}:
             pipeline_status = "ok"
 
-        for stage in self.stages:
-            stage_name = getattr(stage, "name", str(type(stage).__name__))
-            stage_id = getattr(stage, "stage_id", stage_name)
-            requires = getattr(stage, "requires", []) or []
-
-            missing = self._missing_requirements(context, requires)
+        for stage, stage_name, stage_id, requirements in self._stage_plan:
+            missing = self._missing_requirements(context, requirements)
             if missing:
                 stage_errors.append({
                     "stage_id": stage_id,
@@ -86,30 +84,47 @@ class AnalysisPipeline:
         context.metadata = validate_metadata_contract(context.metadata)
         return context
 
+    @classmethod
+    def _plan_stage(cls, stage: PipelineStage) -> Tuple:
+        stage_name = getattr(stage, "name", str(type(stage).__name__))
+        stage_id = getattr(stage, "stage_id", stage_name)
+        requirements = cls._parse_requirements(getattr(stage, "requires", []) or [])
+        return (stage, stage_name, stage_id, requirements)
+
     @staticmethod
-    def _missing_requirements(context: AnalysisContext, requires: List[str]) -> List[str]:
-        missing = []
+    def _parse_requirements(requires: List[str]) -> Tuple[Tuple[str, Tuple[Tuple[bool, str], ...]], ...]:
+        """
+        Parse requirement strings into (requirement, options) pairs.
+
+        Each option is (from_metadata, name): "metadata.key" checks
+        context.metadata["key"], anything else a context attribute.
+        """
+        parsed = []
         for requirement in requires:
             if not requirement:
                 continue
-            options = [option.strip() for option in requirement.split("|") if option.strip()]
-            if not options:
-                continue
-
-            satisfied = False
-            for option in options:
+            options = []
+            for option in requirement.split("|"):
+                option = option.strip()
+                if not option:
+                    continue
                 if option.startswith("metadata."):
-                    key = option.split(".", 1)[1]
-                    value = context.metadata.get(key)
-                    if value is not None and not (isinstance(value, str) and value == ""):
-                        satisfied = True
-                        break
+                    options.append((True, option.split(".", 1)[1]))
                 else:
-                    value = getattr(context, option, None)
-                    if value is not None and not (isinstance(value, str) and value == ""):
-                        satisfied = True
-                        break
+                    options.append((False, option))
+            if options:
+                parsed.append((requirement, tuple(options)))
+        return tuple(parsed)
 
-            if not satisfied:
+    @staticmethod
+    def _missing_requirements(context: AnalysisContext, requirements) -> List[str]:
+        missing = []
+        metadata = context.metadata
+        for requirement, options in requirements:
+            for from_metadata, name in options:
+                value = metadata.get(name) if from_metadata else getattr(context, name, None)
+                if value is not None and not (isinstance(value, str) and value == ""):
+                    break
+            else:
                 missing.append(requirement)
         return missing
@@ -43,6 +43,22 @@ class ContextEnhancerStage(PipelineStage):
         ("node_class_literal", r"class\s+'([^']+Node)'", 0.5),
     ]
 
+    # Compiled once at import; process() runs for every recorded error and
+    # re.search() with a pattern string pays a cache lookup per call.
+    _NODE_ID_RES = [
+        (name, re.compile(pattern, re.IGNORECASE), confidence)
+        for name, pattern, confidence in NODE_ID_PATTERNS
+    ]
+    _COMPAT_EVENT_RES = {
+        field_name: (name, re.compile(pattern, re.IGNORECASE), confidence)
+        for field_name, (name, pattern, confidence) in COMPAT_EVENT_PATTERNS.items()
+    }
+    _CUSTOM_NODE_RE = re.compile(CUSTOM_NODE_PATTERN[1])
+    _NODE_CLASS_RES = [
+        (name, re.compile(pattern), confidence)
+        for name, pattern, confidence in NODE_CLASS_PATTERNS
+    ]
+
     def __init__(self):
         self._name = "ContextEnhancerStage"
         self.stage_id = "context_enhancer"
@@ -113,8 +129,8 @@ class ContextEnhancerStage(PipelineStage):
     def _extract_node_identity(
         self, node_data: dict, traceback_text: str, provenance: dict
     ) -> None:
-        for idx, (pattern_name, pattern, confidence) in enumerate(self.NODE_ID_PATTERNS):
-            match = re.search(pattern, traceback_text, re.IGNORECASE)
+        for idx, (pattern_name, pattern, confidence) in enumerate(self._NODE_ID_RES):
+            match = pattern.search(traceback_text)
             if not match:
                 continue
 
@@ -140,8 +156,13 @@ class ContextEnhancerStage(PipelineStage):
     def _extract_compat_fields(
         self, node_data: dict, traceback_text: str, provenance: dict
     ) -> None:
-        for field_name, (pattern_name, pattern, confidence) in self.COMPAT_EVENT_PATTERNS.items():
-            match = re.search(pattern, traceback_text, re.IGNORECASE)
+        # Every compat pattern requires its field name literally; most
+        # tracebacks carry none, so skip the regex scans outright.
+        lowered = traceback_text.lower()
+        for field_name, (pattern_name, pattern, confidence) in self._COMPAT_EVENT_RES.items():
+            if field_name not in lowered:
+                continue
+            match = pattern.search(traceback_text)
             if not match:
                 continue
 
@@ -158,7 +179,7 @@ class ContextEnhancerStage(PipelineStage):
     def _extract_custom_node_path(
         self, node_data: dict, traceback_text: str, provenance: dict
     ) -> None:
-        custom_node_match = re.search(self.CUSTOM_NODE_PATTERN[1], traceback_text)
+        custom_node_match = self._CUSTOM_NODE_RE.search(traceback_text)
         if not custom_node_match or node_data.get("custom_node_path"):
             return
 
@@ -170,8 +191,8 @@ class ContextEnhancerStage(PipelineStage):
     def _extract_node_class(
         self, node_data: dict, traceback_text: str, provenance: dict
     ) -> None:
-        for pattern_name, pattern, confidence in self.NODE_CLASS_PATTERNS:
-            class_match = re.search(pattern, traceback_text)
+        for pattern_name, pattern, confidence in self._NODE_CLASS_RES:
+            class_match = pattern.search(traceback_text)
             if not class_match:
                 continue
 
@@ -1,6 +1,9 @@
+import hashlib
 import logging
 import re
-from typing import List, Tuple, Optional, Any
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Optional, Any
 from ..base import PipelineStage
 from ..context import AnalysisContext
 from ..plugins import discover_plugins
@@ -15,17 +18,23 @@ except ImportError as import_error:
     from config import CONFIG
 
 try:
-    from ...i18n import get_suggestion, ERROR_KEYS
+    from ...i18n import get_suggestion, get_language, ERROR_KEYS
     from ...pattern_loader import get_pattern_loader
     # analyzer import removed to avoid circular dependency
 except ImportError as import_error:
     from import_compat import ensure_absolute_import_fallback_allowed
     ensure_absolute_import_fallback_allowed(import_error)
-    from i18n import get_suggestion, ERROR_KEYS
+    from i18n import get_suggestion, get_language, ERROR_KEYS
     from pattern_loader import get_pattern_loader
 
 logger = logging.getLogger(__name__)
 
+# Recent JSON/legacy match results per (text digest, UI language, pattern-set
+# generation). Identical errors recur constantly and matching dominates the
+# pipeline. Only the suggestion and match fields are cached; later stages
+# rebuild context metadata (logs, manifest, token estimate) on every run.
+_MATCH_CACHE_SIZE = 256
+
 def _infer_category_from_key(error_key: str) -> str:
     """
     Infer error category from error_key for statistics tracking.
@@ -65,6 +74,8 @@ class PatternMatcherStage(PipelineStage):
         ]
         self.version = "1.0"
         self.legacy_patterns = legacy_patterns or []
+        self._match_cache: "OrderedDict[Tuple[str, str, Any], Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._match_cache_lock = threading.Lock()
         self.plugins = []
         if load_plugins is None:
             load_plugins = getattr(CONFIG, "enable_community_plugins", False)
@@ -101,14 +112,49 @@ class PatternMatcherStage(PipelineStage):
             except Exception as e:
                 logger.warning(f"Plugin matcher failed: {e}")
 
+        # 2-4. Built-in matchers. Deterministic for a given text, language and
+        # pattern set, so repeats reuse the cached result. No-match is not cached.
+        # The key hashes the sanitized text, so it cannot reuse the raw-text
+        # error signature the logger persists with history entries.
+        key = (
+            hashlib.sha256(text_to_analyze.encode("utf-8", errors="ignore")).hexdigest(),
+            get_language(),
+            self._pattern_generation(),
+        )
+        with self._match_cache_lock:
+            cached = self._match_cache.get(key)
+            if cached is not None:
+                self._match_cache.move_to_end(key)
+
+        if cached is None:
+            cached = self._match_builtin(text_to_analyze)
+            if cached is None:
+                return
+            with self._match_cache_lock:
+                self._match_cache[key] = cached
+                if len(self._match_cache) > _MATCH_CACHE_SIZE:
+                    self._match_cache.popitem(last=False)
+
+        suggestion, match_metadata = cached
+        context.suggestion = suggestion
+        context.metadata.update(match_metadata)
+
+    @staticmethod
+    def _pattern_generation() -> Any:
+        try:
+            return get_pattern_loader().generation
+        except Exception:
+            return None
+
+    def _match_builtin(self, text_to_analyze: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Run JSON, legacy and generic matchers; return (suggestion, match metadata)."""
         # 2. Try PatternLoader (JSON)
         try:
             loader = get_pattern_loader()
             result = loader.match(text_to_analyze)
             if result:
                 error_key, groups = result
-                self._apply_suggestion(context, error_key, groups, source="json_loader")
-                return  # Short-circuit
+                return self._build_suggestion(error_key, groups, source="json_loader")
         except Exception as e:
             logger.warning(f"PatternLoader match failed: {e}")
 
@@ -119,19 +165,19 @@ class PatternMatcherStage(PipelineStage):
                 match = re.search(pattern, text_to_analyze, re.IGNORECASE)
                 if match:
                     groups = match.groups() if has_groups else ()
-                    self._apply_suggestion(context, error_key, groups, source="legacy_fallback")
-                    return  # Short-circuit
+                    return self._build_suggestion(error_key, groups, source="legacy_fallback")
             except Exception as e:
                 logger.warning(f"Legacy pattern match failed: {e}")
-                
+
         # 4. Generic Fallback (e.g. Autograd) - Copied from original analyzer
         if "grad_fn" in text_to_analyze:
-             # autograd_generic
-             self._apply_suggestion(context, ERROR_KEYS.get("AUTOGRAD", "autograd_error"), (), source="generic_fallback")
+            # autograd_generic
+            return self._build_suggestion(ERROR_KEYS.get("AUTOGRAD", "autograd_error"), (), source="generic_fallback")
 
+        return None
 
-    def _apply_suggestion(self, context: AnalysisContext, error_key: str, groups: tuple, source: str):
-        """Helper to format suggestion and update context."""
+    def _build_suggestion(self, error_key: str, groups: tuple, source: str) -> Tuple[str, Dict[str, Any]]:
+        """Helper to format the suggestion and its match metadata."""
         suggestion_key = ERROR_KEYS.get(error_key, error_key)
         
         # Build suggestion text
@@ -142,8 +188,6 @@ class PatternMatcherStage(PipelineStage):
                 suggestion = get_suggestion(suggestion_key)
         except Exception:
             suggestion = get_suggestion(suggestion_key)
-            
-        context.suggestion = suggestion
         
         # Get Pattern Info for metadata
         try:
@@ -168,12 +212,12 @@ class PatternMatcherStage(PipelineStage):
             except Exception:
                  pass
 
-        context.metadata.update({
+        return suggestion, {
             'matched_pattern_id': matched_id,
             'category': category,
             'priority': priority,
             'match_source': source
-        })
+        }
 
     def _normalize_plugin_result(self, result: Any, plugin_id: str):
         if not result:
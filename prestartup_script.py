@@ -149,9 +149,14 @@ class PrestartupLogger:
         except (OSError, AttributeError, UnicodeError, ValueError):
             pass  # Stream may be unavailable during early startup
         try:
-            if PrestartupLogger._log_file:
-                PrestartupLogger._log_file.write(message)
-                PrestartupLogger._log_file.flush()
+            log_file = PrestartupLogger._log_file
+            if log_file:
+                log_file.write(message)
+                # print() writes text and "\n" separately; flushing on line
+                # boundaries keeps every completed line on disk for crash
+                # capture without one flush per fragment.
+                if "\n" in message:
+                    log_file.flush()
         except (OSError, AttributeError, UnicodeError, ValueError):
             pass  # Log file may be unavailable
 
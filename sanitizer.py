@@ -158,6 +158,23 @@ class PIISanitizer:
             for name, (pattern, _) in self.STRICT_PATTERNS.items():
                 self._compiled_patterns[name] = re.compile(pattern, re.IGNORECASE)
 
+    def _may_contain_pii(self, text: str) -> bool:
+        """
+        Cheap superset test for PATTERNS/STRICT_PATTERNS (keep in sync).
+
+        Every pattern needs a path separator, '@', ':' or '.', one of the
+        API-key prefixes or 'localhost' - except STRICT's hex tokens, which
+        need 32+ characters. Short keys/values ("role", "user", node class
+        names) thereby skip the regex battery.
+        """
+        if "\\" in text or "/" in text or "@" in text or ":" in text or "." in text:
+            return True
+        # casefold() also maps the characters IGNORECASE equates with 's'/'k'.
+        folded = text.casefold()
+        if "sk-" in folded or "key_" in folded or "token_" in folded or "localhost" in folded:
+            return True
+        return self.level == SanitizationLevel.STRICT and len(text) >= 32
+
     def sanitize(self, text: str) -> SanitizationResult:
         """
         Sanitize text by removing PII.
@@ -168,7 +185,7 @@ class PIISanitizer:
         Returns:
             SanitizationResult with sanitized text and metadata
         """
-        if self.level == SanitizationLevel.NONE or not text:
+        if self.level == SanitizationLevel.NONE or not text or not self._may_contain_pii(text):
             return SanitizationResult(
                 sanitized_text=text,
                 pii_found=False,
@@ -19,7 +19,7 @@ class ConfirmationTokenService:
     Tokens are single-use (`validate_and_consume`) and have a short TTL.
     """
     
-    # Token -> (expiry_timestamp, metadata_string)
+    # Token -> (expiry as time.monotonic() deadline, metadata_string)
     _tokens: Dict[str, Tuple[float, str]] = {}
     TTL_SECONDS = 300  # 5 minutes
 
@@ -30,7 +30,7 @@ class ConfirmationTokenService:
         Metadata is optional context (e.g., 'upload-dataset-v1').
         """
         token = str(uuid.uuid4())
-        expiry = time.time() + cls.TTL_SECONDS
+        expiry = time.monotonic() + cls.TTL_SECONDS
         cls._tokens[token] = (expiry, metadata)
         return token
 
@@ -48,7 +48,7 @@ class ConfirmationTokenService:
         # ALWAYS remove token to prevent replay, regardless of expiry status
         del cls._tokens[token]
         
-        if time.time() > expiry:
+        if time.monotonic() > expiry:
             logger.warning(f"Confirmation token expired (meta: {meta})")
             return False
             
@@ -60,7 +60,7 @@ class ConfirmationTokenService:
         Remove expired tokens to prevent memory leaks.
         Returns count of removed items.
         """
-        now = time.time()
+        now = time.monotonic()
         expired = [t for t, (exp, _) in cls._tokens.items() if now > exp]
         for t in expired:
             del cls._tokens[t]
@@ -38,6 +38,13 @@ FATAL_MARKERS = [
     re.compile(r'^CUDA\s+out\s+of\s+memory', re.IGNORECASE),
 ]
 
+# All FATAL_MARKERS in one anchored alternation; group N+1 is FATAL_MARKERS[N].
+# Leading whitespace is skipped by the pattern instead of strip()-ing each line.
+_FATAL_MARKER_RE = re.compile(
+    r'\s*(?:' + '|'.join(f'({pattern.pattern[1:]})' for pattern in FATAL_MARKERS) + ')',
+    re.IGNORECASE,
+)
+
 # ═══════════════════════════════════════════════════════════════════════════
 # DATA CLASSES
 # ═══════════════════════════════════════════════════════════════════════════
@@ -218,11 +225,9 @@ def detect_fatal_pattern(line: str) -> Optional[str]:
     if not line:
         return None
     
-    line = line.strip()
-    
-    for i, pattern in enumerate(FATAL_MARKERS):
-        if pattern.match(line):
-            return f"fatal_marker_{i}"
+    match = _FATAL_MARKER_RE.match(line)
+    if match:
+        return f"fatal_marker_{match.lastindex - 1}"
     
     return None
 
@@ -48,7 +48,7 @@ class DiagnosticsRunner:
     def __init__(self):
         self._checks: List[Callable[[Dict[str, Any], HealthCheckRequest], Awaitable[List[HealthIssue]]]] = []
         self._check_names: List[str] = []
-        self._cache: Dict[str, tuple[HealthReport, float]] = {}  # (report, timestamp)
+        self._cache: Dict[str, tuple[HealthReport, float]] = {}  # (report, time.monotonic() when cached)
         self._last_report: Optional[HealthReport] = None
         self._intent_scorer: Optional[Any] = None  # Set by services/intent
 
@@ -149,7 +149,7 @@ class DiagnosticsRunner:
         """Get cached report if still valid."""
         if cache_key in self._cache:
             report, timestamp = self._cache[cache_key]
-            if time.time() - timestamp < self.CACHE_TTL_SECONDS:
+            if time.monotonic() - timestamp < self.CACHE_TTL_SECONDS:
                 logger.debug(f"Cache hit for {cache_key[:16]}...")
                 return report
             else:
@@ -158,7 +158,7 @@ class DiagnosticsRunner:
 
     def _cache_report(self, cache_key: str, report: HealthReport):
         """Cache a report with current timestamp."""
-        self._cache[cache_key] = (report, time.time())
+        self._cache[cache_key] = (report, time.monotonic())
         # Limit cache size
         if len(self._cache) > 100:
             # Remove oldest entries
@@ -198,7 +198,7 @@ class DiagnosticsRunner:
         Returns:
             HealthReport with issues, score, and optional intent signature
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         workflow = request.workflow or {}
         workflow_hash = self.compute_workflow_hash(workflow)
 
@@ -253,7 +253,7 @@ class DiagnosticsRunner:
         counts = HealthReport.count_issues(all_issues)
 
         # Build report
-        duration_ms = int((time.time() - start_time) * 1000)
+        duration_ms = int((time.monotonic() - start_time) * 1000)
         report = HealthReport(
             report_id=str(uuid.uuid4()),
             timestamp=utc_isoformat(),
@@ -5,7 +5,8 @@ Bounded ring buffer for capturing recent execution logs.
 Features:
 - O(1) append with bounded memory
 - Sanitization at retrieval (not at capture)
-- Thread-safe with lock-free deque
+- Consecutive repeats stored once, with a count line
+- Thread-safe: writers and readers share one short lock
 
 Usage:
     from services.log_ring_buffer import get_ring_buffer
@@ -19,6 +20,7 @@ Usage:
 """
 
 import logging
+import threading
 from collections import deque
 from typing import List, Optional, Callable
 from dataclasses import dataclass, field
@@ -35,6 +37,11 @@ class RingBufferConfig:
     max_lines: int = 1000  # Maximum lines to keep
     sanitize_on_retrieval: bool = True  # Apply S6 sanitization
     filter_noise: bool = True  # Filter DEBUG/VERBOSE lines
+    collapse_repeats: bool = True  # Store consecutive identical lines once
+
+def _repeat_marker(count: int) -> str:
+    """Line stored in place of `count` repeats of the line before it."""
+    return f"[previous line repeated {count} more time{'s' if count != 1 else ''}]"
 
 # ═══════════════════════════════════════════════════════════════════════════
 # LOG RING BUFFER
@@ -45,7 +52,8 @@ class LogRingBuffer:
     Bounded ring buffer for recent log lines.
     
     Uses deque(maxlen=N) for O(1) append and automatic eviction.
-    Thread-safe for single-writer scenarios (GIL protection).
+    Thread-safe: the stdout and stderr wrappers both write here, so appends
+    and the repeat-collapse state are updated under one lock.
     """
     
     def __init__(self, config: Optional[RingBufferConfig] = None):
@@ -57,6 +65,10 @@ class LogRingBuffer:
         """
         self.config = config or RingBufferConfig()
         self._buffer: deque = deque(maxlen=self.config.max_lines)
+        # Last stored line and how often it has repeated since (collapse_repeats)
+        self._last_line: Optional[str] = None
+        self._repeats = 0
+        self._lock = threading.Lock()
         self._sanitizer: Optional[Callable[[str], str]] = None
         
         # Try to load sanitizer lazily
@@ -80,22 +92,63 @@ class LogRingBuffer:
     def add_line(self, line: str) -> None:
         """
         Add a log line to the buffer.
-        
+
         Args:
             line: Raw log line (not sanitized yet)
         """
-        if not line:
+        self.add_lines((line,))
+
+    def add_lines(self, lines: List[str]) -> None:
+        """
+        Add several log lines at once.
+
+        Blank lines and (with filter_noise) DEBUG/TRACE/VERBOSE lines are
+        skipped; with collapse_repeats a line equal to the previous stored
+        line only increments a pending repeat count.
+
+        Args:
+            lines: Raw log lines in arrival order
+        """
+        # Filtering needs no shared state, so it runs before taking the lock.
+        # Blank writes (print() sends its trailing "\n" separately) carry no
+        # context and would otherwise take half of the recent-lines window.
+        filter_noise = self.config.filter_noise
+        kept = []
+        for line in lines:
+            if not line or line.isspace():
+                continue
+            if filter_noise:
+                line_lower = line.lower()
+                if 'debug:' in line_lower or '[trace]' in line_lower or 'verbose:' in line_lower:
+                    continue
+            kept.append(line)
+        if not kept:
             return
-        
-        # Optional noise filtering
-        if self.config.filter_noise:
-            line_lower = line.lower()
-            # Skip very verbose lines
-            if any(skip in line_lower for skip in ['debug:', '[trace]', 'verbose:']):
+
+        with self._lock:
+            if not self.config.collapse_repeats:
+                self._buffer.extend(kept)
                 return
-        
-        self._buffer.append(line)
-    
+            # A warning printed in a loop would otherwise fill the window.
+            append = self._buffer.append
+            for line in kept:
+                if line == self._last_line:
+                    self._repeats += 1
+                    continue
+                if self._repeats:
+                    append(_repeat_marker(self._repeats))
+                    self._repeats = 0
+                self._last_line = line
+                append(line)
+
+    def _snapshot(self) -> List[str]:
+        """Buffered lines plus the marker for repeats not yet flushed."""
+        with self._lock:
+            lines = list(self._buffer)
+            if self._repeats:
+                lines.append(_repeat_marker(self._repeats))
+        return lines
+
     def get_recent(self, n: int = 50, sanitize: Optional[bool] = None) -> List[str]:
         """
         Get the most recent N log lines.
@@ -110,7 +163,7 @@ class LogRingBuffer:
         should_sanitize = sanitize if sanitize is not None else self.config.sanitize_on_retrieval
         
         # Get last N items
-        recent = list(self._buffer)[-n:]
+        recent = self._snapshot()[-n:]
         
         if should_sanitize and self._sanitizer:
             return [self._sanitizer(line) for line in recent]
@@ -128,7 +181,7 @@ class LogRingBuffer:
         Returns:
             List of log lines centered on the pattern
         """
-        all_lines = list(self._buffer)
+        all_lines = self._snapshot()
         
         # Find the pattern
         pattern_idx = None
@@ -153,7 +206,10 @@ class LogRingBuffer:
     
     def clear(self) -> None:
         """Clear all buffered lines."""
-        self._buffer.clear()
+        with self._lock:
+            self._buffer.clear()
+            self._last_line = None
+            self._repeats = 0
     
     def __len__(self) -> int:
         """Return current buffer size."""
@@ -192,6 +248,12 @@ def get_ring_buffer(config: Optional[RingBufferConfig] = None) -> LogRingBuffer:
 
 
 def reset_ring_buffer() -> None:
-    """Reset the global ring buffer (for testing)."""
+    """
+    Reset the global ring buffer (for testing).
+
+    The next get_ring_buffer() call creates a fresh instance. Installed
+    SafeStreamWrappers look the global instance up on each write, so they
+    switch to the new buffer without being reinstalled.
+    """
     global _ring_buffer
     _ring_buffer = None
@@ -103,7 +103,7 @@ def get_system_environment(force_refresh: bool = False) -> Dict[str, Any]:
     """
     global _cache_timestamp, _cached_env_info
 
-    current_time = time.time()
+    current_time = time.monotonic()
     cache_valid = (
         _cache_timestamp is not None
         and _cached_env_info is not None
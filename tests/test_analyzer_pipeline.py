@@ -63,3 +63,51 @@ def test_empty_traceback():
     
     node_ctx = ErrorAnalyzer.extract_node_context("")
     assert not node_ctx.is_valid()
+
+
+def test_pattern_matcher_caches_matches_per_pattern_generation():
+    """Repeats reuse the match until the pattern set or language changes; misses are not cached."""
+    from unittest.mock import patch
+    from pipeline.stages.pattern_matcher import PatternMatcherStage
+
+    class FakeLoader:
+        generation = 1
+
+        def __init__(self):
+            self.calls = []
+
+        def match(self, text):
+            self.calls.append(text)
+            return ("OOM", ()) if "memory" in text else None
+
+        def get_pattern_info(self, error_key):
+            return None
+
+    loader = FakeLoader()
+    stage = PatternMatcherStage(load_plugins=False)
+    language = {"value": "en"}
+
+    def run(text):
+        ctx = AnalysisContext(traceback=text, sanitized_traceback=text)
+        stage.process(ctx)
+        return ctx
+
+    with patch("pipeline.stages.pattern_matcher.get_pattern_loader", return_value=loader), \
+         patch("pipeline.stages.pattern_matcher.get_language", lambda: language["value"]):
+        first = run("CUDA out of memory")
+        second = run("CUDA out of memory")
+        assert len(loader.calls) == 1
+        assert second.suggestion == first.suggestion
+        assert second.metadata["match_source"] == "json_loader"
+
+        run("unrelated failure")
+        run("unrelated failure")
+        assert len(loader.calls) == 3
+
+        loader.generation = 2
+        run("CUDA out of memory")
+        assert len(loader.calls) == 4
+
+        language["value"] = "ja"
+        run("CUDA out of memory")
+        assert len(loader.calls) == 5
@@ -39,3 +39,14 @@ def test_context_extraction_captures_execution_error_compat_fields():
     assert provenance["parent_node_found"] is True
     assert provenance["real_node_id_found"] is True
     assert provenance["compat_fields"] == ["display_node", "parent_node", "real_node_id"]
+
+
+def test_context_extraction_compat_fields_match_case_insensitively():
+    ctx = AnalysisContext(traceback="RuntimeError: boom DISPLAY_NODE=12:7, Real_Node_Id=7")
+    stage = ContextEnhancerStage()
+    stage.process(ctx)
+
+    assert ctx.node_context is not None
+    assert ctx.node_context.display_node == "12:7"
+    assert ctx.node_context.real_node_id == "7"
+    assert ctx.node_context.parent_node is None
@@ -176,6 +176,12 @@ class TestDetectFatalPattern:
         assert detect_fatal_pattern("") is None
         assert detect_fatal_pattern(None) is None
 
+    def test_marker_index_matches_fatal_markers_order(self):
+        """Should report the FATAL_MARKERS index and ignore leading whitespace."""
+        assert detect_fatal_pattern("  RuntimeError: boom\n") == "fatal_marker_2"
+        assert detect_fatal_pattern("\tcuda OUT of memory") == "fatal_marker_5"
+        assert detect_fatal_pattern("[ComfyUI] ERROR: bad node") == "fatal_marker_3"
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # TESTS: build_context_manifest
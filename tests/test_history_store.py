@@ -5,6 +5,7 @@ import unittest
 import os
 import sys
 import json
+import hashlib
 import tempfile
 import shutil
 
@@ -149,6 +150,42 @@ class TestHistoryStore(unittest.TestCase):
         history = store.get_all()
         self.assertEqual(len(history), 2)
     
+    def test_append_many_matches_sequential_append(self):
+        """append_many aggregates like repeated append() calls."""
+        store = HistoryStore(self.test_file, maxlen=10)
+
+        store.append_many([
+            HistoryEntry(timestamp="2025-12-29T14:00:00", error="Same error", suggestion={}),
+            HistoryEntry(timestamp="2025-12-29T14:00:10", error="Other error", suggestion={}),
+            HistoryEntry(timestamp="2025-12-29T14:00:30", error="Same error", suggestion={}),
+        ])
+
+        history = store.get_all()
+        self.assertEqual([h["error"] for h in history], ["Other error", "Same error"])
+        self.assertEqual(history[1].get("repeat_count"), 2)
+
+        reloaded = HistoryStore(self.test_file, maxlen=10)
+        self.assertEqual(len(reloaded.get_all()), 2)
+
+    def test_legacy_entries_get_signature_cached_on_merge(self):
+        """Entries saved without error_signature are hashed once and persisted."""
+        with open(self.test_file, "w", encoding="utf-8") as f:
+            json.dump([
+                {"timestamp": "2025-12-29T13:00:00", "error": "Legacy A", "suggestion": {}},
+                {"timestamp": "2025-12-29T13:10:00", "error": "Legacy B", "suggestion": {}},
+            ], f)
+
+        store = HistoryStore(self.test_file, maxlen=10)
+        store.append(HistoryEntry(timestamp="2025-12-29T14:00:00", error="New", suggestion={}))
+
+        with open(self.test_file, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+        self.assertEqual(len(saved), 3)
+        self.assertEqual(
+            saved[1]["error_signature"],
+            hashlib.sha256("Legacy B".encode("utf-8")).hexdigest(),
+        )
+
     def test_persistence_across_instances(self):
         """Test that history persists across store instances."""
         store1 = HistoryStore(self.test_file, maxlen=10)
@@ -34,3 +34,92 @@ def test_priority_drop_when_queue_full_of_priority():
     assert stats["queue_dropped_total"] == 1
     assert stats["queue_dropped_priority"] == 1
     assert stats["queue_dropped_oldest"] == 1
+
+
+def test_put_wakes_blocked_consumer():
+    import threading
+
+    queue = DroppingQueue(maxsize=4)
+    received = []
+    consumer = threading.Thread(target=lambda: received.append(queue.get(timeout=5.0)))
+    consumer.start()
+
+    # Wait until the consumer is parked in get() so put_nowait() must notify it.
+    for _ in range(200):
+        if queue._waiters:
+            break
+        threading.Event().wait(0.01)
+    assert queue.put_nowait("line", priority=False) is True
+
+    consumer.join(timeout=2.0)
+    assert received == [(False, "line")]
+
+
+def test_get_batch_drains_in_order_up_to_limit():
+    import queue as queue_module
+
+    queue = DroppingQueue(maxsize=8)
+    for i in range(5):
+        queue.put_nowait(f"line-{i}", priority=(i == 2))
+
+    assert [item for _, item in queue.get_batch(timeout=0, max_items=3)] == ["line-0", "line-1", "line-2"]
+    assert [item for _, item in queue.get_batch(timeout=0)] == ["line-3", "line-4"]
+
+    try:
+        queue.get_batch(timeout=0)
+    except queue_module.Empty:
+        pass
+    else:
+        raise AssertionError("empty queue should raise queue.Empty")
+
+
+def test_logger_metrics_report_queue_backpressure(monkeypatch):
+    import logger
+
+    message_queue = DroppingQueue(maxsize=1)
+    message_queue.put_nowait("first", priority=False)
+    message_queue.put_nowait("dropped", priority=False)
+    writer = logger.DoctorHistoryWriter(maxsize=1)  # not started: submissions stay pending
+    writer.submit(object())
+    writer.submit(object())  # pending queue is full: dropped, not buffered
+
+    monkeypatch.setattr(logger, "_message_queue", message_queue)
+    monkeypatch.setattr(logger, "_log_processor", None)
+    monkeypatch.setattr(logger, "_history_writer", writer)
+
+    metrics = logger.get_logger_metrics()
+    assert metrics["queue_size"] == 1
+    assert metrics["queue_dropped_non_priority"] == 1
+    assert metrics["history_write_pending"] == 1
+    assert metrics["history_write_dropped"] == 1
+
+
+def test_lock_free_producers_keep_per_thread_order():
+    import queue as queue_module
+    import threading
+
+    queue = DroppingQueue(maxsize=0)
+    producers = [
+        threading.Thread(target=lambda n=n: [queue.put_nowait((n, i)) for i in range(500)])
+        for n in range(4)
+    ]
+    received = []
+
+    def consume():
+        while len(received) < 2000:
+            try:
+                received.extend(item for _, item in queue.get_batch(timeout=2.0))
+            except queue_module.Empty:
+                return
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    for producer in producers:
+        producer.start()
+    for producer in producers:
+        producer.join()
+    consumer.join(timeout=5.0)
+
+    assert len(received) == 2000
+    for n in range(4):
+        assert [i for p, i in received if p == n] == list(range(500))
@@ -285,3 +285,661 @@ def test_internal_logger_stream_is_write_safe():
             handler.emit(record)
     finally:
         handler.stream = original_stream
+
+
+def test_flush_safe_proxy_tolerates_missing_stream_methods():
+    """Streams without write/flush (or None under pythonw) stay no-ops."""
+    from logger import FlushSafeProxy
+
+    class WriteOnly:
+        def __init__(self):
+            self.data = []
+
+        def write(self, data):
+            self.data.append(data)
+            return len(data)
+
+    stream = WriteOnly()
+    proxy = FlushSafeProxy(stream)
+    assert proxy.write("abc") == 3
+    assert proxy.flush() is None
+    assert stream.data == ["abc"]
+
+    missing = FlushSafeProxy(None)
+    assert missing.write("abc") == 0
+    assert missing.flush() is None
+
+
+def test_maybe_terminal_line_skips_frame_lines():
+    """Completion checks are only needed when the last line is unindented."""
+    from logger import _maybe_terminal_line
+
+    assert _maybe_terminal_line("RuntimeError: CUDA out of memory") is True
+    assert _maybe_terminal_line("Executing prompt: abc\n") is True
+    assert _maybe_terminal_line('  File "test.py", line 1\nValueError: bad\n') is True
+    assert _maybe_terminal_line('  File "test.py", line 1') is False
+    assert _maybe_terminal_line("    ^^^^^^^^\n") is False
+    assert _maybe_terminal_line("RuntimeError: bad state_dict:\n\tMissing key(s): a\n") is True
+    assert _maybe_terminal_line("\n") is False
+    assert _maybe_terminal_line("") is False
+
+
+def test_single_write_traceback_completes_on_next_message():
+    """A traceback emitted in one write must still complete on the following line."""
+    import logger
+
+    logger.clear_analysis_history()
+    processor = logger.DoctorLogProcessor(logger.DroppingQueue(maxsize=4))
+    processor._process_message(
+        "Traceback (most recent call last):\n"
+        '  File "test.py", line 1, in <module>\n'
+        "RuntimeError: CUDA out of memory\n"
+    )
+    assert processor.in_traceback is True
+
+    processor._process_message("\n")
+
+    assert processor.in_traceback is False
+    assert "CUDA out of memory" in (logger.get_last_analysis().get("error") or "")
+    logger.clear_analysis_history()
+
+
+def test_exception_message_ending_in_indented_line_completes_at_once(monkeypatch):
+    """An exception whose message ends in tab-indented detail completes on that write."""
+    import logger
+
+    recorded = []
+    monkeypatch.setattr(
+        logger.DoctorLogProcessor,
+        "_record_analysis",
+        lambda self, text, suggestion, metadata=None, error_signature=None: recorded.append(text),
+    )
+    processor = logger.DoctorLogProcessor(logger.DroppingQueue(maxsize=4))
+    processor._process_message("Traceback (most recent call last):\n")
+    processor._process_message('  File "nodes.py", line 12, in load\n')
+    processor._process_message(
+        "RuntimeError: Error(s) in loading state_dict for UNet:\n"
+        '\tMissing key(s) in state_dict: "input_blocks.0.weight".\n'
+    )
+
+    assert processor.in_traceback is False
+    assert len(recorded) == 1
+    assert recorded[0].endswith('"input_blocks.0.weight".\n')
+
+    processor._process_message("got prompt\n")
+    processor._process_message("model weight dtype torch.float16, manual cast: None\n")
+    assert len(recorded) == 1
+
+    # The gate pairs "unindented" and "exception line" on the same line
+    processor._process_message("Traceback (most recent call last):\n")
+    processor._process_message('  File "nodes.py", line 12, in load\n')
+    processor._process_message('    model.load_state_dict(sd)\n')
+    assert processor._may_complete_buffer("\tdetail: value\nplain progress line\n") is False
+    assert processor._may_complete_buffer("plain line\nValueError: bad\n") is True
+
+
+def test_history_writer_persists_entries_off_thread(monkeypatch):
+    """History persistence runs on DoctorHistoryWriter and is flushed on stop()."""
+    from unittest.mock import MagicMock
+    import logger
+    from history_store import HistoryEntry
+
+    store = MagicMock()
+    monkeypatch.setattr(logger, "_get_history_store", lambda: store)
+
+    writer = logger.DoctorHistoryWriter()
+    writer.start()
+    monkeypatch.setattr(logger, "_history_writer", writer)
+
+    entry = HistoryEntry(timestamp="2026-01-01T00:00:00Z", error="RuntimeError: x", suggestion={})
+    logger._persist_history_entry(entry)
+    writer.stop()
+
+    assert not writer.is_alive()
+    store.append_many.assert_called_once_with([entry])
+
+
+def _start_stalled_history_writer(monkeypatch, tmp_path):
+    """Real HistoryStore plus a running writer; hold store._lock to stall its writes."""
+    import logger
+    from history_store import HistoryEntry, HistoryStore
+
+    store = HistoryStore(str(tmp_path / "history.json"))
+    store.append(HistoryEntry(timestamp="2026-01-01T00:00:00Z", error="ValueError: old", suggestion={}))
+    monkeypatch.setattr(logger, "_get_history_store", lambda: store)
+    monkeypatch.setattr(logger, "_message_queue", None)
+    monkeypatch.setattr(logger, "_log_processor", None)
+
+    writer = logger.DoctorHistoryWriter()
+    writer.start()
+    monkeypatch.setattr(logger, "_history_writer", writer)
+    return store, writer
+
+
+def _wait_until_taken(writer):
+    """Wait until the writer has taken every queued entry into its batch."""
+    import time
+
+    deadline = time.monotonic() + 5.0
+    while writer.pending() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert writer.pending() == 0
+
+
+def test_history_reads_include_entries_the_writer_has_not_written(monkeypatch, tmp_path):
+    import logger
+    from history_store import HistoryEntry, HistoryStore
+
+    store, writer = _start_stalled_history_writer(monkeypatch, tmp_path)
+    new_ts = "2026-01-01T00:01:00Z"
+    try:
+        with store._lock:
+            logger._persist_history_entry(HistoryEntry(timestamp=new_ts, error="RuntimeError: new", suggestion={}))
+            _wait_until_taken(writer)
+
+            history = logger.get_analysis_history()
+            assert [entry["error"] for entry in history] == ["RuntimeError: new", "ValueError: old"]
+            assert logger.update_resolution_status(new_ts, "resolved") is True
+            assert logger.get_analysis_history()[0]["resolution_status"] == "resolved"
+    finally:
+        writer.stop()
+
+    persisted = HistoryStore(str(tmp_path / "history.json")).get_all()
+    assert [(entry["error"], entry["resolution_status"]) for entry in persisted] == [
+        ("RuntimeError: new", "resolved"),
+        ("ValueError: old", "unresolved"),
+    ]
+    # Written once: not counted again from the writer's bookkeeping.
+    assert len(logger.get_analysis_history()) == 2
+
+
+def test_clear_history_discards_batch_the_writer_is_holding(monkeypatch, tmp_path):
+    import logger
+    from history_store import HistoryEntry, HistoryStore
+
+    store, writer = _start_stalled_history_writer(monkeypatch, tmp_path)
+    try:
+        with store._lock:
+            logger._persist_history_entry(
+                HistoryEntry(timestamp="2026-01-01T00:01:00Z", error="RuntimeError: new", suggestion={})
+            )
+            _wait_until_taken(writer)
+            assert logger.clear_analysis_history() is True
+            assert logger.get_analysis_history() == []
+    finally:
+        writer.stop()
+
+    assert not writer.is_alive()
+    assert store.get_all() == []
+    assert HistoryStore(str(tmp_path / "history.json")).get_all() == []
+
+
+def test_history_reads_include_entries_the_writer_dropped_or_failed_to_save(monkeypatch, tmp_path):
+    import logger
+    from history_store import HistoryEntry, HistoryStore
+
+    store = HistoryStore(str(tmp_path / "history.json"))
+    monkeypatch.setattr(logger, "_get_history_store", lambda: store)
+    writer = logger.DoctorHistoryWriter(maxsize=1)  # not started: the first entry stays queued
+    monkeypatch.setattr(logger, "_history_writer", writer)
+
+    writer.submit(HistoryEntry(timestamp="2026-01-01T00:01:00Z", error="RuntimeError: queued", suggestion={}))
+    writer.submit(HistoryEntry(timestamp="2026-01-01T00:02:00Z", error="RuntimeError: dropped", suggestion={}))
+    assert writer.dropped == 1
+    assert [entry["error"] for entry in logger.get_analysis_history()] == [
+        "RuntimeError: dropped",
+        "RuntimeError: queued",
+    ]
+    assert logger.update_resolution_status("2026-01-01T00:02:00Z", "ignored") is True
+
+    def fail(entries):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(store, "append_many", fail)
+    writer.start()
+    writer.stop()
+
+    assert writer.unwritten()[0].error == "RuntimeError: queued"
+    history = logger.get_analysis_history()
+    assert [(entry["error"], entry["resolution_status"]) for entry in history] == [
+        ("RuntimeError: dropped", "ignored"),
+        ("RuntimeError: queued", "unresolved"),
+    ]
+    assert store.get_all() == []
+
+
+def test_capture_priority_skips_plain_lines_outside_traceback(monkeypatch):
+    """Plain output is not queued unless a traceback/error capture is in progress."""
+    import logger
+
+    logger._TRACEBACK_ACTIVE.clear()
+    monkeypatch.setattr(logger, "_capture_deadline", 0.0)
+
+    assert logger._capture_priority("got prompt\n") is None
+    assert logger._capture_priority("cuda out of memory while loading\n") is False
+    # Follow-up frame lines are queued before the processor sets _TRACEBACK_ACTIVE.
+    assert logger._capture_priority('  File "test.py", line 1\n') is False
+    assert logger._capture_priority("Traceback (most recent call last):\n") is True
+    assert logger._capture_priority("ERROR: Failed to validate prompt for output 9:\n") is True
+
+    monkeypatch.setattr(logger, "_capture_deadline", 0.0)
+    logger._TRACEBACK_ACTIVE.set()
+    try:
+        assert logger._capture_priority("Prompt executed in 1.0 seconds\n") is True
+    finally:
+        logger._TRACEBACK_ACTIVE.clear()
+
+
+def test_capture_prefilter_admits_every_trigger_spelling():
+    """The lowercase substring gate never hides a line the trigger regex matches."""
+    import logger
+
+    samples = [
+        "Traceback (most recent call last):",
+        "failed to validate prompt for output 9",
+        "Critical: tensor contains NaN",
+        "meta TENSOR (no data)",
+        "RuntimeError: boom",
+        "oom-killer invoked",
+        "Cuda  Out\tof\nMemory",
+    ]
+    for sample in samples:
+        assert logger._CAPTURE_TRIGGER_RE.search(sample), sample
+        assert logger._may_trigger_capture(sample.lower()), sample
+
+    assert not logger._may_trigger_capture("100%|##########| 20/20 [00:03<00:00,  5.91it/s]")
+
+
+def test_repeated_error_reflects_current_ring_buffer():
+    """Identical errors reuse the match but rebuild context metadata from live logs."""
+    import logger
+    from services.log_ring_buffer import get_ring_buffer, reset_ring_buffer, RingBufferConfig
+
+    reset_ring_buffer()
+    ring = get_ring_buffer(RingBufferConfig(sanitize_on_retrieval=False))
+    text = "Traceback (most recent call last):\nRuntimeError: CUDA out of memory. Tried to allocate 2.00 GiB\n"
+    try:
+        ring.add_lines(["loading model", "sampling step 1"])
+        first_suggestion, first = logger._analyze(text)
+
+        ring.add_lines(["sampling step 2", "sampling step 3", "sampling step 4"])
+        second_suggestion, second = logger._analyze(text)
+    finally:
+        reset_ring_buffer()
+
+    assert first_suggestion and second_suggestion == first_suggestion
+    assert first["matched_pattern_id"] == second["matched_pattern_id"]
+    assert first["context_manifest"]["logs_lines"] == 2
+    assert second["context_manifest"]["logs_lines"] == 5
+    assert first is not second
+
+
+def test_safe_stream_wrapper_delegates_stream_attributes_live():
+    """encoding/isatty/fileno follow the wrapped stream, including later reconfiguration."""
+    import io
+    from logger import SafeStreamWrapper, DroppingQueue
+
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="latin-1")
+    wrapper = SafeStreamWrapper(stream, DroppingQueue(maxsize=4))
+
+    assert wrapper.encoding == "latin-1"
+    assert wrapper.isatty() is False
+    assert wrapper.buffer is raw
+
+    stream.reconfigure(encoding="utf-8")
+    assert wrapper.encoding == "utf-8"
+
+
+def test_analysis_history_snapshot_reused_until_next_append(monkeypatch):
+    """In-memory history reads share one snapshot until a new entry is recorded."""
+    import logger
+
+    def no_store():
+        raise RuntimeError("store unavailable")
+
+    monkeypatch.setattr(logger, "_get_history_store", no_store)
+    monkeypatch.setattr(logger, "_analysis_history", logger.deque())
+    monkeypatch.setattr(logger, "_signature_index", {})
+    monkeypatch.setattr(logger, "_analysis_snapshot", None)
+
+    logger._analysis_history.append({"timestamp": "t1", "error": "first"})
+    first = logger.get_analysis_history()
+    snapshot = logger._analysis_snapshot
+    assert [e["timestamp"] for e in first] == ["t1"]
+    assert logger.get_analysis_history() == first
+    assert logger._analysis_snapshot is snapshot
+
+    processor = logger.DoctorLogProcessor(logger.DroppingQueue(maxsize=4))
+    monkeypatch.setattr(logger, "_persist_history_entry", lambda entry: None)
+    monkeypatch.setattr(logger, "_last_analysis", dict(logger._last_analysis))
+    processor._record_analysis("Traceback (most recent call last):\nValueError: second\n", None)
+
+    assert [e["error"].strip().splitlines()[-1] for e in logger.get_analysis_history()] == [
+        "ValueError: second",
+        "first",
+    ]
+
+
+def test_analysis_history_snapshot_holds_copies_and_tracks_aggregation(monkeypatch):
+    """Snapshot entries are copies taken under the lock; in-place repeat updates republish."""
+    import logger
+
+    def no_store():
+        raise RuntimeError("store unavailable")
+
+    monkeypatch.setattr(logger, "_get_history_store", no_store)
+    monkeypatch.setattr(logger, "_persist_history_entry", lambda entry: None)
+    monkeypatch.setattr(logger, "_analysis_history", logger.deque())
+    monkeypatch.setattr(logger, "_signature_index", {})
+    monkeypatch.setattr(logger, "_analysis_snapshot", None)
+    monkeypatch.setattr(logger, "_last_analysis", dict(logger._last_analysis))
+
+    processor = logger.DoctorLogProcessor(logger.DroppingQueue(maxsize=4))
+    text = "Traceback (most recent call last):\nValueError: again\n"
+    processor._record_analysis(text, None)
+    assert logger.get_analysis_history()[0]["repeat_count"] == 1
+    assert logger._analysis_snapshot[0] is not logger._analysis_history[0]
+
+    processor._record_analysis(text, None)
+    history = logger.get_analysis_history()
+    assert len(history) == 1
+    assert history[0]["repeat_count"] == 2
+
+    assert logger.update_resolution_status(history[0]["timestamp"], "resolved")
+    assert logger.get_analysis_history()[0]["resolution_status"] == "resolved"
+
+
+def test_unmatched_error_is_recorded_but_not_printed(monkeypatch, capfd):
+    """Errors without a suggestion or node context stay in history and are persisted."""
+    import logger
+
+    persisted = []
+    monkeypatch.setattr(logger, "_persist_history_entry", persisted.append)
+    monkeypatch.setattr(logger, "_analysis_history", logger.deque())
+    monkeypatch.setattr(logger, "_signature_index", {})
+    monkeypatch.setattr(logger, "_analysis_snapshot", None)
+    monkeypatch.setattr(logger, "_last_analysis", dict(logger._last_analysis))
+
+    processor = logger.DoctorLogProcessor(logger.DroppingQueue(maxsize=4))
+    traceback_text = "Traceback (most recent call last):\nZeroDivisionError: odd\n"
+    processor._record_analysis(traceback_text, None)
+
+    assert logger.get_last_analysis()["error"] == traceback_text
+    assert len(logger._analysis_history) == 1
+    assert len(persisted) == 1
+    assert logger._OUTPUT_RULE not in capfd.readouterr().out
+
+
+def test_marker_sets_drop_subsumed_entries_without_changing_matches():
+    """Pruned marker tuples still match every legacy and ASCII marker."""
+    import logger
+
+    assert "💡 SUGGESTION:" not in logger._DOCTOR_OUTPUT_MARKERS
+    assert "❌ CRITICAL: Tensor contains" not in logger._TENSOR_ALERT_MARKERS
+    for marker in logger._LEGACY_DOCTOR_OUTPUT_MARKERS + logger._ASCII_DOCTOR_OUTPUT_MARKERS:
+        assert logger._contains_any(f"x {marker} y", logger._DOCTOR_OUTPUT_MARKERS)
+    for marker in logger._LEGACY_TENSOR_ALERT_MARKERS + logger._ASCII_TENSOR_ALERT_MARKERS:
+        assert logger._contains_tensor_alert(f"x {marker} y")
+
+
+def test_fatal_pattern_probe_is_cached_by_prefix():
+    """Repeated lines reuse the cached detect_fatal_pattern() result."""
+    import logger
+
+    logger._cached_fatal_pattern.cache_clear()
+    assert logger._fatal_pattern("CUDA out of memory. Tried to allocate") == "fatal_marker_5"
+    assert logger._fatal_pattern("CUDA out of memory. Tried to allocate") == "fatal_marker_5"
+    assert logger._fatal_pattern("got prompt") is None
+
+    metrics = logger.get_logger_metrics()
+    assert metrics["fatal_cache_hits"] == 1
+    assert metrics["fatal_cache_misses"] == 2
+
+
+def test_wrapper_assembles_ring_buffer_lines_from_fragments(monkeypatch):
+    """print()-style fragments reach the ring buffer as whole lines."""
+    import io
+    import logger
+    from logger import SafeStreamWrapper, DroppingQueue
+    from services.log_ring_buffer import get_ring_buffer, reset_ring_buffer, RingBufferConfig
+
+    # Outside an error capture, so plain output is assembled rather than flushed.
+    monkeypatch.setattr(logger, "_capture_deadline", 0.0)
+    logger._TRACEBACK_ACTIVE.clear()
+    reset_ring_buffer()
+    ring = get_ring_buffer(RingBufferConfig(sanitize_on_retrieval=False))
+    wrapper = SafeStreamWrapper(io.StringIO(), DroppingQueue(maxsize=4))
+    try:
+        for fragment in ("got ", "prompt", "\n", "loaded\nmodel", " ready\n"):
+            wrapper.write(fragment)
+        assert ring.get_recent(10) == ["got prompt", "loaded", "model ready"]
+
+        # Newline-free output is capped instead of held back forever.
+        wrapper.write("x" * 5000)
+        assert ring.get_recent(1) == ["x" * 5000]
+    finally:
+        reset_ring_buffer()
+
+
+def test_wrapper_flushes_partial_ring_buffer_lines(monkeypatch):
+    """'\r', flush() and error output push a pending partial line to the ring buffer."""
+    import io
+    import logger
+    from logger import SafeStreamWrapper, DroppingQueue
+    from services.log_ring_buffer import LogRingBuffer, RingBufferConfig
+
+    monkeypatch.setattr(logger, "_capture_deadline", 0.0)
+    logger._TRACEBACK_ACTIVE.clear()
+    ring = LogRingBuffer(RingBufferConfig(sanitize_on_retrieval=False, collapse_repeats=False))
+    wrapper = SafeStreamWrapper(io.StringIO(), DroppingQueue(maxsize=16), ring_buffer=ring)
+
+    # Progress bars redraw with '\r': each finished redraw is a line.
+    wrapper.write("\rsampling 10%")
+    wrapper.write("\rsampling 20%")
+    assert ring.get_recent(10) == ["sampling 10%"]
+    wrapper.write("\r\n")
+    assert ring.get_recent(10) == ["sampling 10%", "sampling 20%"]
+
+    wrapper.write("Loading model... ")
+    assert len(ring) == 2
+    wrapper.flush()
+    assert ring.get_recent(1) == ["Loading model... "]
+
+    # An exception line without a trailing newline is not held back.
+    wrapper.write("RuntimeError: CUDA out of memory")
+    assert ring.get_recent(1) == ["RuntimeError: CUDA out of memory"]
+    wrapper.write("\n")
+    assert len(ring) == 4
+
+
+def test_wrapper_feeds_the_ring_buffer_it_was_given():
+    """An injected ring buffer is used instead of the global instance."""
+    import io
+    from logger import SafeStreamWrapper, DroppingQueue
+    from services.log_ring_buffer import LogRingBuffer, RingBufferConfig, get_ring_buffer, reset_ring_buffer
+
+    reset_ring_buffer()
+    ring = LogRingBuffer(RingBufferConfig(sanitize_on_retrieval=False))
+    try:
+        wrapper = SafeStreamWrapper(io.StringIO(), DroppingQueue(maxsize=4), ring_buffer=ring)
+        wrapper.write("loaded model\n")
+        assert ring.get_recent(10) == ["loaded model"]
+        assert len(get_ring_buffer()) == 0
+    finally:
+        reset_ring_buffer()
+
+
+def test_wrapper_follows_reset_ring_buffer():
+    """Without an injected buffer, writes go to the current global instance."""
+    import io
+    from logger import SafeStreamWrapper, DroppingQueue
+    from services.log_ring_buffer import RingBufferConfig, get_ring_buffer, reset_ring_buffer
+
+    reset_ring_buffer()
+    first = get_ring_buffer(RingBufferConfig(sanitize_on_retrieval=False))
+    try:
+        wrapper = SafeStreamWrapper(io.StringIO(), DroppingQueue(maxsize=4))
+        wrapper.write("before reset\n")
+        assert first.get_recent(10) == ["before reset"]
+
+        reset_ring_buffer()
+        second = get_ring_buffer(RingBufferConfig(sanitize_on_retrieval=False))
+        wrapper.write("after reset\n")
+        assert second.get_recent(10) == ["after reset"]
+        assert first.get_recent(10) == ["before reset"]
+    finally:
+        reset_ring_buffer()
+
+
+def test_analyze_and_record_computes_signature_once(monkeypatch):
+    """_record_analysis reuses the signature _analyze_and_record computed.
+
+    PatternMatcherStage keys its cache on the sanitized text, so it hashes
+    separately; this only covers the raw-text history signature.
+    """
+    import logger
+
+    real_signature = logger._error_signature
+    calls = []
+
+    def counting_signature(text):
+        calls.append(text)
+        return real_signature(text)
+
+    persisted = []
+    monkeypatch.setattr(logger, "_analyze", lambda text: ("suggestion", {"matched_pattern_id": "p"}))
+    monkeypatch.setattr(logger, "_error_signature", counting_signature)
+    monkeypatch.setattr(logger, "_persist_history_entry", persisted.append)
+    monkeypatch.setattr(logger, "_analysis_history", logger.deque())
+    monkeypatch.setattr(logger, "_signature_index", {})
+    monkeypatch.setattr(logger, "_last_analysis", dict(logger._last_analysis))
+
+    processor = logger.DoctorLogProcessor(logger.DroppingQueue(maxsize=4))
+    text = "Traceback (most recent call last):\nValueError: hashed once\n"
+    processor._analyze_and_record(text)
+
+    assert calls == [text]
+    assert persisted[0].error_signature == real_signature(text)
+    assert persisted[0].matched_pattern_id == "p"
+    assert logger._last_analysis["error_signature"] == real_signature(text)
+
+
+def test_repeat_aggregation_uses_signature_index(monkeypatch):
+    """Repeats fold into the indexed entry; evicted entries leave the index."""
+    import logger
+
+    monkeypatch.setattr(logger, "_persist_history_entry", lambda entry: None)
+    monkeypatch.setattr(logger, "_analysis_history", logger.deque(maxlen=2))
+    monkeypatch.setattr(logger, "_signature_index", {})
+    monkeypatch.setattr(logger, "_analysis_snapshot", None)
+    monkeypatch.setattr(logger, "_last_analysis", dict(logger._last_analysis))
+
+    processor = logger.DoctorLogProcessor(logger.DroppingQueue(maxsize=4))
+    first = "Traceback (most recent call last):\nValueError: repeat me\n"
+    processor._record_analysis(first, None)
+    processor._record_analysis(first, None)
+    assert len(logger._analysis_history) == 1
+    assert logger._analysis_history[0]["repeat_count"] == 2
+
+    for n in range(2):
+        processor._record_analysis(f"Traceback (most recent call last):\nKeyError: other {n}\n", None)
+    first_signature = logger._error_signature(first)
+    assert first_signature not in logger._signature_index
+    assert len(logger._signature_index) == 2
+    for entry, _last_seen in logger._signature_index.values():
+        assert any(entry is kept for kept in logger._analysis_history)
+
+
+def test_is_doctor_output_matches_marker_tuple():
+    """The substring-grouped check agrees with scanning _DOCTOR_OUTPUT_MARKERS."""
+    import logger
+
+    samples = [
+        "got prompt\n",
+        "[Doctor-API] GET /doctor/health\n",
+        "[Doctor] internal note\n",
+        "[Doctor-X] not ours\n",
+        "[Doctor-X] SUGGESTION: still ours\n",
+        "DIVISION: not a marker\n",
+        "Traceback (most recent call last):\n",
+    ]
+    samples += [f"x {marker} y" for marker in logger._DOCTOR_OUTPUT_MARKERS]
+    samples += [f"x {marker} y" for marker in logger._LEGACY_DOCTOR_OUTPUT_MARKERS]
+    for sample in samples:
+        assert logger._is_doctor_output(sample) == logger._contains_any(sample, logger._DOCTOR_OUTPUT_MARKERS), sample
+
+
+def test_in_memory_history_stays_within_size_budget(monkeypatch):
+    """With no count limit, the oldest entries give way to history_size_bytes."""
+    import logger
+
+    monkeypatch.setattr(logger, "_persist_history_entry", lambda entry: None)
+    monkeypatch.setattr(logger, "_analysis_history", logger.deque())
+    monkeypatch.setattr(logger, "_signature_index", {})
+    monkeypatch.setattr(logger, "_analysis_history_chars", 0)
+    monkeypatch.setattr(logger, "_analysis_snapshot", None)
+    monkeypatch.setattr(logger, "_last_analysis", dict(logger._last_analysis))
+    monkeypatch.setattr(logger.CONFIG, "history_size_bytes", 300)
+
+    processor = logger.DoctorLogProcessor(logger.DroppingQueue(maxsize=4))
+    for n in range(5):
+        processor._record_analysis(f"Traceback (most recent call last):\nValueError: {n} {'x' * 80}\n", None)
+
+    assert logger._analysis_history_chars <= 300
+    assert len(logger._analysis_history) == 2
+    assert logger._analysis_history[-1]["error"].startswith("Traceback (most recent call last):\nValueError: 4")
+    assert len(logger._signature_index) == 2
+
+    # history_size_bytes=0 disables the size limit as well
+    monkeypatch.setattr(logger.CONFIG, "history_size_bytes", 0)
+    for n in range(5, 10):
+        processor._record_analysis(f"Traceback (most recent call last):\nValueError: {n} {'x' * 80}\n", None)
+    assert len(logger._analysis_history) == 7
+
+
+def test_record_output_bypasses_wrapped_dunder_stdout(monkeypatch):
+    """The diagnostic block never re-enters SafeStreamWrapper via sys.__stdout__."""
+    import io
+    import logger
+
+    raw = io.StringIO()
+    queue = logger.DroppingQueue(maxsize=8)
+    monkeypatch.setattr(logger.sys, "__stdout__", logger.SafeStreamWrapper(raw, queue))
+    monkeypatch.setattr(logger, "_persist_history_entry", lambda entry: None)
+    monkeypatch.setattr(logger, "_analysis_history", logger.deque())
+    monkeypatch.setattr(logger, "_signature_index", {})
+    monkeypatch.setattr(logger, "_last_analysis", dict(logger._last_analysis))
+
+    processor = logger.DoctorLogProcessor(logger.DroppingQueue(maxsize=4))
+    monkeypatch.setattr(logger, "_capture_deadline", 0.0)
+    logger._TRACEBACK_ACTIVE.clear()
+    # The suggestion text would trip the capture filter if it went through the wrapper.
+    processor._record_analysis(
+        "Traceback (most recent call last):\nValueError: shown\n",
+        "SUGGESTION: CUDA out of memory, lower the batch size",
+    )
+
+    assert logger._OUTPUT_RULE in raw.getvalue()
+    assert queue.qsize() == 0
+
+
+def test_record_output_lists_node_location_fields(monkeypatch):
+    """Only the node context fields that were found appear on the location line."""
+    import io
+    import logger
+
+    raw = io.StringIO()
+    monkeypatch.setattr(logger.sys, "__stdout__", raw)
+    monkeypatch.setattr(logger, "_persist_history_entry", lambda entry: None)
+    monkeypatch.setattr(logger, "_analysis_history", logger.deque())
+    monkeypatch.setattr(logger, "_signature_index", {})
+    monkeypatch.setattr(logger, "_last_analysis", dict(logger._last_analysis))
+
+    processor = logger.DoctorLogProcessor(logger.DroppingQueue(maxsize=4))
+    processor._record_analysis(
+        "Failed to validate prompt for output 9:\n* KSampler 3:\n  - Required input is missing: model\n",
+        "SUGGESTION: connect a model",
+    )
+
+    assert "ERROR LOCATION: Node ID: #3 | Name: KSampler\n" in raw.getvalue()
@@ -1,5 +1,7 @@
 from pipeline.metadata_contract import (
     METADATA_SCHEMA_VERSION,
+    MAX_LIST_ITEMS,
+    MAX_NESTED_DEPTH,
     MAX_STRING_LENGTH,
     validate_metadata_contract,
 )
@@ -29,3 +31,26 @@ def test_metadata_contract_quarantines_invalid_fields():
     assert "stage_errors" in invalid
     assert "extra" in invalid
 
+
+
+def test_metadata_contract_enforces_nested_limits():
+    def nest(levels):
+        value = "leaf"
+        for _ in range(levels):
+            value = {"child": value}
+        return value
+
+    metadata = {
+        "plugin": nest(MAX_NESTED_DEPTH),
+        "context_manifest": nest(MAX_NESTED_DEPTH + 1),
+        "workflow_pruning": {"nodes": [{"id": "x" * (MAX_STRING_LENGTH + 1)}]},
+        "context_extraction": {"lines": list(range(MAX_LIST_ITEMS + 1))},
+    }
+
+    validated = validate_metadata_contract(metadata)
+
+    assert validated["plugin"] == metadata["plugin"]
+    invalid = validated.get("_invalid", {})
+    assert "context_manifest" in invalid
+    assert "workflow_pruning" in invalid
+    assert "context_extraction" in invalid
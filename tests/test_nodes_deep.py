@@ -4,10 +4,13 @@ import sys
 import unittest
 from unittest.mock import MagicMock
 
+import pytest
+
 # --- MOCKING DEPENDENCIES FOR TESTING NODES.PY ---
-# 1. Mock torch with real capability to carry attributes
+# 1. Mock torch with real capability to carry attributes. Values live in a
+# flat list so reshape/slicing/reductions return real numbers.
 class MockTensor:
-    def __init__(self, shape, dtype="float32", device="cpu", has_nan=False, has_inf=False, requires_grad=False):
+    def __init__(self, shape, dtype="float32", device="cpu", has_nan=False, has_inf=False, requires_grad=False, values=None):
         self.shape = shape
         self.dtype = dtype
         self.device = device
@@ -15,15 +18,35 @@ class MockTensor:
         self.requires_grad = requires_grad
         self._has_nan = has_nan
         self._has_inf = has_inf
+        self._values = list(values) if values is not None else [0.0] * self.numel()
+        self.reshape_calls = []
 
     def numel(self):
-        return self.shape[0] * self.shape[1] if hasattr(self.shape, '__getitem__') else 1
-
-    def min(self): return MagicMock(item=lambda: -1.0)
-    def max(self): return MagicMock(item=lambda: 1.0)
-    def mean(self): return MagicMock(item=lambda: 0.0)
+        count = 1
+        for dim in self.shape:
+            count *= dim
+        return count
+
+    def _scalar(self, value):
+        return MockTensor((), dtype=self.dtype, values=[value])
+
+    def reshape(self, *shape):
+        self.reshape_calls.append(shape)
+        return MockTensor((len(self._values),), dtype=self.dtype, device=self.device, values=self._values)
+
+    def min(self): return self._scalar(min(self._values))
+    def max(self): return self._scalar(max(self._values))
+    def mean(self): return self._scalar(sum(self._values) / len(self._values))
+    def float(self): return MockTensor(self.shape, dtype="float32", values=[float(v) for v in self._values])
+    def item(self): return self._values[0]
+    def tolist(self): return self._values[0] if self.shape == () else list(self._values)
     def flatten(self): return self
-    def __getitem__(self, idx): return self
+    def __getitem__(self, idx):
+        values = self._values[idx]
+        return MockTensor((len(values),), dtype=self.dtype, device=self.device, values=values)
+
+def mock_stack(tensors):
+    return MockTensor((len(tensors),), dtype=tensors[0].dtype, values=[t.item() for t in tensors])
 
 # torch.isnan mock
 def mock_isnan(tensor):
@@ -36,10 +59,17 @@ def mock_isinf(tensor):
     m.any().item.return_value = tensor._has_inf
     return m
 
+def mock_isfinite(tensor):
+    m = MagicMock()
+    m.all().item.return_value = not (tensor._has_nan or tensor._has_inf)
+    return m
+
 mock_torch = MagicMock()
 mock_torch.Tensor = MockTensor
 mock_torch.isnan = mock_isnan
 mock_torch.isinf = mock_isinf
+mock_torch.isfinite = mock_isfinite
+mock_torch.stack = mock_stack
 sys.modules['torch'] = mock_torch
 
 # --- PROJECT SETUP ---
@@ -78,3 +108,148 @@ model = MockModel()
 node.debug_print(model, "MODEL_TEST")
 
 print("\n>>> TEST COMPLETE")
+
+
+def _stats_line(tensor, monkeypatch, capsys):
+    import nodes
+
+    monkeypatch.setattr(nodes, "torch", mock_torch)
+    DebugPrintNode().debug_print(tensor, "STATS")
+    stats = [line.strip() for line in capsys.readouterr().out.splitlines() if "Stats" in line]
+    assert len(stats) == 1
+    return stats[0]
+
+
+def test_debug_print_stats_for_float_tensor(monkeypatch, capsys):
+    tensor = MockTensor((2, 2), values=[0.5, -1.25, 2.0, 3.0])
+    assert _stats_line(tensor, monkeypatch, capsys) == "Stats (All): Min=-1.2500, Max=3.0000, Mean=1.0625"
+
+
+def test_debug_print_stats_keep_int_and_bool_dtypes(monkeypatch, capsys):
+    ints = MockTensor((1, 3), dtype="int64", values=[3, -2, 7])
+    assert _stats_line(ints, monkeypatch, capsys) == "Stats (All): Min=-2.0000, Max=7.0000, Mean=2.6667"
+
+    bools = MockTensor((3,), dtype="bool", values=[True, False, True])
+    assert _stats_line(bools, monkeypatch, capsys) == "Stats (All): Min=0.0000, Max=1.0000, Mean=0.6667"
+
+
+def test_debug_print_stats_sample_first_10k_of_large_tensors(monkeypatch, capsys):
+    # Only the first 10k values are reduced: the 5.0 at the end is not seen.
+    tensor = MockTensor((200001,), values=[1.0] * 10000 + [0.0] * 190000 + [5.0])
+    assert _stats_line(tensor, monkeypatch, capsys) == "Stats (First 10k): Min=1.0000, Max=1.0000, Mean=1.0000"
+
+
+def _printed_value(data, capsys):
+    DebugPrintNode().debug_print(data, "LEAF")
+    values = [line.strip() for line in capsys.readouterr().out.splitlines() if "Value:" in line]
+    assert len(values) == 1
+    return values[0]
+
+
+class _ScalarWrapper:
+    """numpy-scalar-like leaf: unwraps via .item(), repr is huge."""
+
+    def __init__(self, value):
+        self._value = value
+
+    def item(self):
+        return self._value
+
+    def __repr__(self):
+        return "x" * 10_000_000
+
+
+def test_debug_print_numeric_leaves_print_their_value(capsys):
+    from decimal import Decimal
+    from fractions import Fraction
+
+    assert _printed_value(Fraction(1, 3), capsys) == "Value: 1/3"
+    assert _printed_value(Decimal("2.50"), capsys) == "Value: 2.50"
+    assert _printed_value(_ScalarWrapper(7), capsys) == "Value: 7"
+    assert _printed_value(True, capsys) == "Value: True"
+
+
+def test_debug_print_opaque_leaves_print_type_name(capsys):
+    class Sampler:
+        def item(self):
+            raise ValueError("can only convert an array of size 1")
+
+    sampler = Sampler()
+    assert _printed_value(sampler, capsys) == f"Value: <Sampler at 0x{id(sampler):x}>"
+    wrapped = _ScalarWrapper("not a number")
+    assert _printed_value(wrapped, capsys) == f"Value: <_ScalarWrapper at 0x{id(wrapped):x}>"
+
+
+def test_debug_print_numpy_scalars_print_their_value(capsys):
+    np = pytest.importorskip("numpy")
+    assert _printed_value(np.int64(7), capsys) == "Value: 7"
+    assert _printed_value(np.float32(1.5), capsys) == "Value: 1.5"
+    assert _printed_value(np.array([2.5]), capsys) == "Value: 2.5"
+
+
+def _capture_prints(monkeypatch):
+    """Record each print() call in nodes; output still reaches capsys."""
+    import builtins
+    import nodes
+
+    monkeypatch.setattr(nodes, "torch", mock_torch)
+    calls = []
+
+    def recording_print(*args):
+        calls.append(" ".join(map(str, args)))
+        builtins.print(*args)
+
+    monkeypatch.setattr(nodes, "print", recording_print, raising=False)
+    return calls
+
+
+def _tensor_block(indent):
+    return "\n".join([
+        f"{indent}Type: Tensor",
+        f"{indent}Shape: (2, 2)",
+        f"{indent}Dtype: float32",
+        f"{indent}Device: cpu",
+        f"{indent}Stats (All): Min=-1.0000, Max=2.0000, Mean=0.5000",
+    ])
+
+
+def test_debug_print_emits_one_print_per_tensor(monkeypatch, capsys):
+    calls = _capture_prints(monkeypatch)
+    tensor = MockTensor((2, 2), values=[-1.0, 0.0, 1.0, 2.0])
+    DebugPrintNode().debug_print(tensor, "TENSOR")
+
+    assert calls == ["\n[TENSOR] Data Inspection:", _tensor_block("  ")]
+    assert capsys.readouterr().out == "".join(call + "\n" for call in calls)
+    # Flattened with reshape(-1): no view() (fails on permuted tensors), no copy.
+    assert tensor.reshape_calls == [(-1,)]
+
+
+def test_debug_print_emits_one_print_per_tensor_in_list(monkeypatch, capsys):
+    calls = _capture_prints(monkeypatch)
+    tensor = MockTensor((2, 2), values=[-1.0, 0.0, 1.0, 2.0])
+    DebugPrintNode().debug_print([tensor, tensor], "LIST")
+
+    assert calls == [
+        "\n[LIST] Data Inspection:",
+        "  Type: list (len=2)",
+        "  [0]:",
+        _tensor_block("    "),
+        "  ... (hidden 1 items)",
+    ]
+    assert capsys.readouterr().out == "".join(call + "\n" for call in calls)
+
+
+def test_debug_print_emits_one_print_per_tensor_in_dict(monkeypatch, capsys):
+    calls = _capture_prints(monkeypatch)
+    tensor = MockTensor((2, 2), values=[-1.0, 0.0, 1.0, 2.0])
+    DebugPrintNode().debug_print({"a": tensor, "b": 2}, "DICT")
+
+    assert calls == [
+        "\n[DICT] Data Inspection:",
+        "  Type: Dict (keys=['a', 'b'])",
+        "  Key 'a':",
+        _tensor_block("    "),
+        "  Key 'b':",
+        "    Value: 2",
+    ]
+    assert capsys.readouterr().out == "".join(call + "\n" for call in calls)
@@ -44,3 +44,20 @@ def test_init_routes_use_outbound_sanitization_funnel():
         init_path = project_root / "__init__.py.bak"
     init_text = init_path.read_text(encoding="utf-8")
     assert "sanitize_outbound_payload(payload, sanitizer)" in init_text
+
+
+def test_sanitize_outbound_payload_handles_deep_nesting_without_mutation():
+    sanitizer, _ = get_outbound_sanitizer("https://api.openai.com/v1", "basic")
+    leaf = {"path": "/home/alice/private", "n": 1, "flags": [True, None]}
+    payload = leaf
+    for _ in range(5000):
+        payload = {"child": [payload]}
+
+    sanitized = sanitize_outbound_payload(payload, sanitizer)
+
+    node = sanitized
+    for _ in range(5000):
+        node = node["child"][0]
+    assert "<USER_HOME>" in node["path"]
+    assert node["n"] == 1 and node["flags"] == [True, None]
+    assert leaf["path"] == "/home/alice/private"
@@ -6,6 +6,7 @@ Tests the JSON-based error pattern loader with hot-reload capability.
 
 import os
 import sys
+import re
 import json
 import time
 import tempfile
@@ -111,6 +112,10 @@ def test_pattern_matching():
         error_key, groups = result
         assert error_key == "OOM"
         assert groups == []
+
+        # Empty input never reaches the regex engine
+        assert loader.match("") is None
+        assert loader.match(None) is None
         print("PASS Test 3 passed: Pattern matching")
 
 
@@ -153,6 +158,31 @@ def test_priority_sorting():
         print("PASS Test 4 passed: Priority sorting")
 
 
+def test_get_pattern_info_lookup():
+    """Test 4b: get_pattern_info resolves by error_key or id, highest priority first."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pattern_file = Path(tmpdir) / "test.json"
+        test_data = {
+            "version": "1.0.0",
+            "patterns": [
+                {"id": "oom_low", "regex": "OOM", "error_key": "OOM",
+                 "priority": 10, "category": "memory"},
+                {"id": "oom_high", "regex": "CUDA OOM", "error_key": "OOM",
+                 "priority": 90, "category": "memory"},
+            ]
+        }
+
+        with open(pattern_file, 'w', encoding='utf-8') as f:
+            json.dump(test_data, f)
+
+        loader = PatternLoader([tmpdir])
+        loader.load()
+
+        assert loader.get_pattern_info("OOM")["id"] == "oom_high"
+        assert loader.get_pattern_info("oom_low")["priority"] == 10
+        assert loader.get_pattern_info("missing") is None
+
+
 def test_hot_reload():
     """Test 5: Hot-reload detects file changes."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -179,6 +209,8 @@ def test_hot_reload():
         loader = PatternLoader([tmpdir])
         loader.load()
         assert len(loader.patterns) == 1
+        published = loader.compiled_patterns
+        assert loader.reload_if_changed() is False, "Unchanged files should not reload"
 
         # Wait to ensure mtime changes
         time.sleep(1.1)
@@ -213,6 +245,16 @@ def test_hot_reload():
         reloaded = loader.reload_if_changed()
         assert reloaded is True, "Should detect file change"
         assert len(loader.patterns) == 2, "Should have 2 patterns after reload"
+        # Reload publishes a new set; a match() already iterating keeps the old one intact
+        assert len(loader.compiled_patterns) == 2
+        assert len(published) == 1
+
+        # A newly added pattern file is picked up; non-JSON files are ignored
+        (Path(tmpdir) / "notes.txt").write_text("ignored", encoding='utf-8')
+        assert loader.reload_if_changed() is False
+        with open(Path(tmpdir) / "extra.json", 'w', encoding='utf-8') as f:
+            json.dump({"version": "1.0.0", "patterns": []}, f)
+        assert loader.reload_if_changed() is True
         print("PASS Test 5 passed: Hot-reload")
 
 
@@ -331,6 +373,31 @@ def test_real_patterns_load():
     print(f"PASS Test 9 passed: Real patterns loaded ({stats['total']} total)")
 
 
+def test_value_not_in_list_pattern_is_linear():
+    """Test 10: value_not_in_list captures the value without backtracking blowup."""
+    from pattern_loader import get_pattern_loader, reset_pattern_loader
+
+    reset_pattern_loader()
+    loader = get_pattern_loader()
+    info = loader.get_pattern_info("value_not_in_list")
+    compiled = re.compile(info["regex"])
+
+    samples = {
+        "ValueError: scheduler 'Normal' not in list": "Normal",
+        "model 'sdxl.safetensors' is not in the list": "sdxl.safetensors",
+        "ValueError: euler_x is not in the list": "euler_x",
+    }
+    for text, expected in samples.items():
+        match = compiled.search(text)
+        assert match is not None, text
+        assert match.group(1) == expected
+
+    # A long line without the suffix used to backtrack quadratically
+    start = time.perf_counter()
+    assert compiled.search("a " * 6000) is None
+    assert time.perf_counter() - start < 1.0
+
+
 if __name__ == "__main__":
     print("\n" + "=" * 70)
     print("TEST: PatternLoader Tests (STAGE 2)")
@@ -341,11 +408,13 @@ if __name__ == "__main__":
         test_schema_validation()
         test_pattern_matching()
         test_priority_sorting()
+        test_get_pattern_info_lookup()
         test_hot_reload()
         test_fallback_on_error()
         test_multiple_directories()
         test_duplicate_id_detection()
         test_real_patterns_load()
+        test_value_not_in_list_pattern_is_linear()
 
         print("\n" + "=" * 70)
         print("DONE: All PatternLoader tests passed!")
@@ -51,3 +51,22 @@ def test_pipeline_marks_failed_on_exception():
     assert ctx.metadata["pipeline_status"] == "failed"
     assert ctx.metadata["stage_errors"][0]["error"] == "boom"
 
+
+
+def test_pipeline_accepts_any_requirement_option():
+    stage = MissingRequirementStage()
+    stage.requires = ["node_context | metadata.matched_pattern_id"]
+    pipeline = AnalysisPipeline([stage])
+
+    ctx = AnalysisContext(traceback="Traceback (most recent call last): ...")
+    ctx.add_metadata("matched_pattern_id", "cuda_oom")
+    pipeline.run(ctx)
+
+    assert ctx.metadata["pipeline_status"] == "ok"
+    assert ctx.metadata.get("stage_errors", []) == []
+
+    ctx = AnalysisContext(traceback="Traceback (most recent call last): ...")
+    ctx.add_metadata("matched_pattern_id", "")
+    pipeline.run(ctx)
+
+    assert ctx.metadata["stage_errors"][0]["missing"] == ["node_context | metadata.matched_pattern_id"]
@@ -73,6 +73,70 @@ class TestLogRingBuffer:
         
         assert len(buffer) == 1
     
+    def test_whitespace_only_writes_ignored(self):
+        """Should ignore the bare newline writes emitted by print()."""
+        buffer = LogRingBuffer(RingBufferConfig(sanitize_on_retrieval=False))
+        buffer.add_line("got prompt")
+        buffer.add_line("\n")
+        buffer.add_line("  \t\n")
+        
+        assert buffer.get_recent(10) == ["got prompt"]
+    
+    def test_add_lines_filters_like_add_line(self):
+        """Should apply the blank and noise filters to batched lines."""
+        buffer = LogRingBuffer(RingBufferConfig(filter_noise=True, sanitize_on_retrieval=False))
+        buffer.add_lines(["got prompt", "", "  ", "DEBUG: noisy", "[TRACE] x", "ERROR: bad"])
+        
+        assert buffer.get_recent(10) == ["got prompt", "ERROR: bad"]
+    
+    def test_consecutive_repeats_collapsed(self):
+        """Should store a repeated line once and count the repeats."""
+        buffer = LogRingBuffer(RingBufferConfig(sanitize_on_retrieval=False))
+        buffer.add_line("WARNING: deprecated option")
+        buffer.add_lines(["WARNING: deprecated option"] * 3 + ["got prompt", "got prompt"])
+        buffer.add_line("Prompt executed")
+
+        assert buffer.get_recent(10) == [
+            "WARNING: deprecated option",
+            "[previous line repeated 3 more times]",
+            "got prompt",
+            "[previous line repeated 1 more time]",
+            "Prompt executed",
+        ]
+
+        keep_all = LogRingBuffer(RingBufferConfig(sanitize_on_retrieval=False, collapse_repeats=False))
+        keep_all.add_lines(["same", "same"])
+        assert keep_all.get_recent(10) == ["same", "same"]
+
+    def test_pending_repeats_visible_to_readers(self):
+        """A line still repeating when the error hits must show its count."""
+        buffer = LogRingBuffer(RingBufferConfig(sanitize_on_retrieval=False))
+        buffer.add_lines(["got prompt"] + ["WARNING: low VRAM"] * 4)
+
+        expected = ["got prompt", "WARNING: low VRAM", "[previous line repeated 3 more times]"]
+        assert buffer.get_recent(10) == expected
+        assert buffer.get_around_error("low vram", window=5) == expected
+
+    def test_concurrent_writers_keep_repeat_counts(self):
+        """stdout and stderr writers must not lose each other's repeat updates."""
+        import threading
+
+        buffer = LogRingBuffer(RingBufferConfig(sanitize_on_retrieval=False, max_lines=100000))
+        start = threading.Barrier(2)
+
+        def write():
+            start.wait()
+            for _ in range(2000):
+                buffer.add_line("same")
+
+        threads = [threading.Thread(target=write) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert buffer.get_recent(10) == ["same", "[previous line repeated 3999 more times]"]
+
     def test_get_recent_limit(self):
         """Should respect the N limit in get_recent."""
         buffer = LogRingBuffer(RingBufferConfig(sanitize_on_retrieval=False, filter_noise=False))
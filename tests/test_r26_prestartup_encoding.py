@@ -146,6 +146,43 @@ def test_prestartup_logger_swallows_unicode_console_failures():
         module.PrestartupLogger.uninstall()
 
 
+def test_prestartup_logger_flushes_log_file_per_completed_line():
+    spec = importlib.util.spec_from_file_location("doctor_r26_prestartup_flush", PRESTARTUP_PATH)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    class CountingFile:
+        def __init__(self):
+            self.chunks = []
+            self.flushes = 0
+
+        def write(self, message):
+            self.chunks.append(message)
+
+        def flush(self):
+            self.flushes += 1
+
+        def close(self):
+            pass
+
+    log_file = CountingFile()
+    old_log_file = module.PrestartupLogger._log_file
+    module.PrestartupLogger._log_file = log_file
+    try:
+        wrapper = module.PrestartupLogger(AsciiOnlyStream())
+        for fragment in ("Import times", " for custom nodes:", "\n", "0.1 seconds: a\n0.2 seconds: b\n"):
+            wrapper.write(fragment)
+        assert "".join(log_file.chunks) == "Import times for custom nodes:\n0.1 seconds: a\n0.2 seconds: b\n"
+        assert log_file.flushes == 2
+
+        wrapper.flush()
+        assert log_file.flushes == 3
+    finally:
+        module.PrestartupLogger._log_file = old_log_file
+        module.PrestartupLogger.uninstall()
+
+
 def test_non_ui_files_do_not_contain_forbidden_emoji():
     for rel_path in ASCII_ONLY_FILES:
         content = _resolve_repo_file(rel_path).read_text(encoding="utf-8")
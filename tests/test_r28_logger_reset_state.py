@@ -39,3 +39,46 @@ def test_doctor_log_processor_reset_traceback_state_clears_buffer_and_flags():
     assert processor.buffer == []
     assert processor.in_traceback is False
     assert processor.last_buffer_time == 0
+
+
+def test_doctor_log_processor_buffer_helpers_track_text_and_validate_flag():
+    import logger
+
+    processor = logger.DoctorLogProcessor(logger.DroppingQueue(maxsize=4))
+    processor._start_buffer("Traceback (most recent call last):\n", 1.0)
+    assert processor._buffer_has_validate is False
+
+    processor._append_buffer("Failed to validate prompt for output 9:\n", 2.0)
+    assert processor._buffer_text == "".join(processor.buffer)
+    assert processor._buffer_has_validate is True
+    assert processor.last_buffer_time == 2.0
+
+    processor.reset_traceback_state()
+
+    assert processor._buffer_text == ""
+    assert processor._buffer_has_validate is False
+
+
+def test_doctor_log_processor_completion_check_resumes_from_checked_length(monkeypatch):
+    import logger
+
+    recorded = []
+    processor = logger.DoctorLogProcessor(logger.DroppingQueue(maxsize=4))
+    monkeypatch.setattr(processor, "_analyze_and_record", lambda text, only_actionable=False: recorded.append(text))
+
+    processor._process_message("Traceback (most recent call last):\n", now=1.0)
+    processor._process_message('  File "x.py", line 1, in <module>\n', now=1.1)
+    processor._process_message("got prompt\n", now=1.2)
+    # Only an exception line can finish a plain traceback: no check, no join.
+    assert processor._buffer_checked_len < len(processor._buffer_text)
+    processor._process_message("Requested to load: SDXL\n", now=1.25)
+    assert processor._buffer_checked_len < len(processor._buffer_text)
+    assert not recorded
+
+    processor._process_message("ValueError: boom\n", now=1.3)
+    assert recorded and recorded[0].endswith("ValueError: boom\n")
+    assert processor._buffer_checked_len == 0
+
+    text = "Traceback (most recent call last):\nValueError: early\n" + "x\n" * 400
+    assert logger.ErrorAnalyzer.is_complete_traceback(text)
+    assert not logger.ErrorAnalyzer.is_complete_traceback(text, scan_from=len(text))
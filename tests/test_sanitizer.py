@@ -339,6 +339,44 @@ class TestPIISanitizerDict:
         assert result["traceback"][2] == "Line 3: No PII"
 
 
+class TestPIISanitizerPrefilter:
+    """Tests for the cheap pre-check in front of the regex patterns."""
+
+    SAMPLES = {
+        "windows_user_path": "C:\\Users\\bob",
+        "unix_home_path": "/home/bob",
+        "api_key": "SK-abcdefghijklmnopqrstuvwxyz",
+        "url_credentials": "https://bob:pw@example.com",
+        "email": "bob@example.com",
+        "private_ipv4": "10.0.0.1",
+        "localhost": "::1",
+        "generic_username": "\\home\\bobby\\",
+        "private_ipv6": "fe80::1",
+        "ssh_fingerprint": "SHA256:" + "A" * 43,
+        "api_key_hex": "a" * 32,
+    }
+
+    def test_every_pattern_sample_passes_prefilter(self):
+        """Each pattern's sample reaches the regex battery and is replaced."""
+        sanitizer = PIISanitizer(SanitizationLevel.STRICT)
+        assert set(self.SAMPLES) == set(sanitizer.PATTERNS) | set(sanitizer.STRICT_PATTERNS)
+
+        for name, sample in self.SAMPLES.items():
+            assert sanitizer._may_contain_pii(sample), name
+            assert name in sanitizer.sanitize(sample).replacements, name
+
+    def test_plain_values_skip_patterns(self):
+        """Short keys/values without trigger characters are returned unchanged."""
+        basic = PIISanitizer(SanitizationLevel.BASIC)
+        for value in ("user", "KSampler", "gpt-4o", "a" * 40):
+            assert basic._may_contain_pii(value) is False
+            result = basic.sanitize(value)
+            assert result.sanitized_text == value
+            assert result.pii_found is False
+
+        assert PIISanitizer(SanitizationLevel.STRICT)._may_contain_pii("a" * 40) is True
+
+
 class TestPIISanitizerMetadata:
     """Tests for sanitization metadata and preview."""
 
@@ -19,3 +19,15 @@ def test_flush_storm_suppression_recursion_guard():
     wrapper.flush()
 
     assert mock_stream.flush.call_count == 3
+
+
+def test_binary_writes_pass_through_without_capture():
+    """Non-text chunks reach the wrapped stream but are never queued for analysis."""
+    mock_stream = MagicMock()
+    message_queue = MagicMock()
+    wrapper = SafeStreamWrapper(mock_stream, message_queue)
+
+    wrapper.write(b"Traceback (most recent call last):\n")
+
+    mock_stream.write.assert_called_once_with(b"Traceback (most recent call last):\n")
+    message_queue.put_nowait.assert_not_called()